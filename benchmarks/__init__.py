@@ -0,0 +1,13 @@
+# benchmarks/__init__.py
+
+from .harness import Case, run_case, compare, load_baseline, save_baseline
+from .cases import CASES
+
+__all__ = [
+    "Case",
+    "run_case",
+    "compare",
+    "load_baseline",
+    "save_baseline",
+    "CASES",
+]
@@ -0,0 +1,58 @@
+"""
+Run the benchmark suite: python -m benchmarks [--save] [--only enemy_move]
+
+Compares every case against benchmarks/baseline.json and exits non-zero
+when one regressed by more than the threshold. --save records the current
+timings as the new baseline.
+"""
+
+import argparse
+import os
+import sys
+from benchmarks import CASES, run_case, compare, load_baseline, save_baseline
+from benchmarks.harness import DEFAULT_SIZES, DEFAULT_THRESHOLD, key
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the frame-step, GA and collision hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Population sizes")
+    parser.add_argument("--only", nargs="+", help="Run only these cases")
+    parser.add_argument("--all-sizes", action="store_true", help="Ignore per-case size caps")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds to measure per case and size")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, help=f"Allowed slowdown (default: baseline's, else {DEFAULT_THRESHOLD})")
+    parser.add_argument("--save", action="store_true", help="Store these timings as the baseline")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.only or case.name in args.only]
+    results = {}
+    for case in cases:
+        for size in case.sizes(args.sizes, args.all_sizes):
+            seconds = run_case(case, size, args.min_time)
+            results[key(case.name, size)] = seconds
+            print(f"{key(case.name, size):<32} {seconds * 1e3:10.3f} ms", flush=True)
+
+    if args.save:
+        save_baseline(args.baseline, results, args.threshold if args.threshold is not None else DEFAULT_THRESHOLD)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline yet; run with --save to record one")
+        return 0
+
+    print()
+    regressions = 0
+    for name, seconds, reference, ratio, regressed in compare(results, load_baseline(args.baseline), args.threshold):
+        if reference is None:
+            print(f"{name:<32} {'new':>10}")
+            continue
+        regressions += regressed
+        print(f"{name:<32} {ratio:9.2f}x {'REGRESSED' if regressed else 'ok'}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
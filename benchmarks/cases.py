@@ -0,0 +1,142 @@
+"""
+Benchmarked hot paths. Every case works on a whole population of `size`
+enemies per call, i.e. the cost of one frame (or one generation) of that
+path at that population size.
+"""
+
+import random
+from constants import *
+from player import Player
+from enemy import Enemy
+from enemy.enemy_bullet import create_spread_bullets
+from enemy.enemy_fitness import calculate_enemy_fitness
+from enemy.enemy_group import apply_group_behavior
+from enemy.firing import FiringScheduler
+from genetic_algorithm import evolve_population
+from world import FrameIndex
+from bullet_pool import bullet_pool
+from benchmarks.harness import Case
+
+BULLETS_PER_ENEMY = 5
+
+
+def population(size):
+    return [Enemy(None) for _ in range(size)]
+
+
+def scattered_bullets(count, width, height, speed):
+    bullets = []
+    for _ in range(count):
+        bullets.append(bullet_pool.acquire(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT),
+                                           random.uniform(-speed, speed), random.uniform(-speed, speed),
+                                           width, height))
+    return bullets
+
+
+def setup_frame(size):
+    player = Player(None)
+    enemies = population(size)
+    return player, enemies
+
+
+def reclaim_bullets(state):
+    player, enemies = state
+    bullet_pool.reclaim(enemies)
+    bullet_pool.reclaim([player])
+
+
+def run_enemy_move(state):
+    player, enemies = state
+    index = FrameIndex(enemies)
+    for enemy in enemies:
+        enemy.move(player, enemies, index)
+
+
+def setup_group_behavior(size):
+    enemies = population(size)
+    return enemies, FrameIndex(enemies)
+
+
+def run_group_behavior(state):
+    enemies, index = state
+    for enemy in enemies:
+        apply_group_behavior(enemy, enemies, index)
+
+
+def setup_player_bullets(size):
+    player, enemies = setup_frame(size)
+    player.bullets = scattered_bullets(size, 5, 10, 10)
+    return player, enemies
+
+
+def run_player_bullets(state):
+    player, enemies = state
+    player.update_bullets(enemies)
+
+
+def setup_enemy_bullets(size):
+    player, enemies = setup_frame(size)
+    player.health = float("inf")
+    for enemy in enemies:
+        enemy.bullets = scattered_bullets(BULLETS_PER_ENEMY, 5, 5, 3)
+    return player, enemies
+
+
+def run_enemy_bullets(state):
+    player, enemies = state
+    for enemy in enemies:
+        enemy.update_bullets(player)
+
+
+def run_spread_bullets(state):
+    player, enemies = state
+    for enemy in enemies:
+        create_spread_bullets(enemy, player, 1.0, 1.0, out=enemy.bullets)
+
+
+def setup_firing(size):
+    # Fresh cooldowns: every enemy fires a volley, the heaviest frame
+    player, enemies = setup_frame(size)
+    return player, enemies, FiringScheduler(enemies)
+
+
+def run_firing(state):
+    player, enemies, scheduler = state
+    scheduler.fire(player)
+
+
+def reclaim_firing(state):
+    reclaim_bullets(state[:2])
+
+
+def setup_scored_population(size):
+    enemies = population(size)
+    for enemy in enemies:
+        enemy.time_alive = random.randint(0, 3600)
+        enemy.shots_fired = random.randint(0, 40)
+        enemy.hits_scored = random.randint(0, enemy.shots_fired)
+        enemy.damage_dealt = enemy.hits_scored * 10
+        enemy.distance_moved = random.uniform(0, 5000)
+        calculate_enemy_fitness(enemy)
+    return enemies
+
+
+def run_evolve_population(enemies):
+    evolve_population(enemies, len(enemies), 0.1)
+
+
+def run_calculate_fitness(enemies):
+    for enemy in enemies:
+        calculate_enemy_fitness(enemy)
+
+
+CASES = [
+    Case("enemy_move", setup_frame, run_enemy_move, max_size=1000, teardown=reclaim_bullets),
+    Case("apply_group_behavior", setup_group_behavior, run_group_behavior, max_size=1000),
+    Case("player_update_bullets", setup_player_bullets, run_player_bullets, teardown=reclaim_bullets),
+    Case("enemy_update_bullets", setup_enemy_bullets, run_enemy_bullets, teardown=reclaim_bullets),
+    Case("create_spread_bullets", setup_frame, run_spread_bullets, teardown=reclaim_bullets),
+    Case("fire_scheduler", setup_firing, run_firing, teardown=reclaim_firing),
+    Case("evolve_population", setup_scored_population, run_evolve_population),
+    Case("calculate_enemy_fitness", setup_scored_population, run_calculate_fitness),
+]
@@ -0,0 +1,93 @@
+"""
+Minimal timing harness: each case builds fresh state with setup(size),
+then only run(state) is timed. Repeats continue until min_time seconds have
+been measured and the median is reported, which is stable enough to catch
+the regressions we care about without pulling in pytest-benchmark or asv.
+"""
+
+import json
+import platform
+import random
+import statistics
+import time
+import numpy as np
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_THRESHOLD = 0.25  # Fail when a case is more than 25% slower than its baseline
+
+
+class Case:
+    """
+    A benchmarked hot path. max_size caps the population it is run at by
+    default (quadratic cases at 10,000 enemies take minutes per repeat).
+    """
+
+    def __init__(self, name, setup, run, max_size=None, teardown=None):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.max_size = max_size
+        self.teardown = teardown
+
+    def sizes(self, sizes, all_sizes=False):
+        if all_sizes or self.max_size is None:
+            return list(sizes)
+        return [size for size in sizes if size <= self.max_size]
+
+
+def key(case_name, size):
+    return f"{case_name}[{size}]"
+
+
+def run_case(case, size, min_time=0.2, max_repeats=1000, min_repeats=3, seed=0):
+    """Median seconds for one run(state) call at `size`"""
+    times = []
+    measured = 0.0
+    while len(times) < min_repeats or (measured < min_time and len(times) < max_repeats):
+        # Same state every repeat, whatever the order cases run in
+        random.seed(seed)
+        np.random.seed(seed)
+        state = case.setup(size)
+        start = time.perf_counter()
+        case.run(state)
+        elapsed = time.perf_counter() - start
+        if case.teardown:
+            case.teardown(state)
+        times.append(elapsed)
+        measured += elapsed
+    return statistics.median(times)
+
+
+def machine():
+    return {"python": platform.python_version(), "machine": platform.machine(), "processor": platform.processor()}
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results, threshold=DEFAULT_THRESHOLD):
+    baseline = {"machine": machine(), "threshold": threshold, "results": results}
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, threshold=None):
+    """
+    [(key, seconds, baseline_seconds or None, ratio or None, regressed)] for
+    every result; a case regresses when it is slower than its baseline by
+    more than the threshold (the baseline's own unless one is given)
+    """
+    if threshold is None:
+        threshold = baseline.get("threshold", DEFAULT_THRESHOLD)
+    rows = []
+    for name, seconds in results.items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            rows.append((name, seconds, None, None, False))
+            continue
+        ratio = seconds / reference
+        rows.append((name, seconds, reference, ratio, ratio > 1 + threshold))
+    return rows
@@ -0,0 +1,89 @@
+"""
+Pool of bullet dicts shared by the player and every enemy. Bullets are
+taken from a free list when fired and handed back when they are removed,
+so steady-state firing allocates nothing; the pool only grows when more
+bullets are in flight than it has ever held before.
+"""
+
+
+class BulletPool:
+    def __init__(self, capacity=1024):
+        self.free = [self._new() for _ in range(capacity)]
+        self.allocated = capacity  # Dicts ever created
+        self.acquired = 0
+        self.peak = 0
+
+    @staticmethod
+    def _new():
+        return {'x': 0.0, 'y': 0.0, 'dx': 0.0, 'dy': 0.0, 'width': 0.0, 'height': 0.0}
+
+    def acquire(self, x, y, dx, dy, width, height):
+        free = self.free
+        if free:
+            bullet = free.pop()
+        else:
+            bullet = self._new()
+            self.allocated += 1
+        bullet['x'] = x
+        bullet['y'] = y
+        bullet['dx'] = dx
+        bullet['dy'] = dy
+        bullet['width'] = width
+        bullet['height'] = height
+        self.acquired += 1
+        in_use = self.allocated - len(free)
+        if in_use > self.peak:
+            self.peak = in_use
+        return bullet
+
+    def release(self, bullet):
+        self.free.append(bullet)
+
+    def release_all(self, bullets):
+        """Return every bullet in a list to the pool and empty the list"""
+        self.free.extend(bullets)
+        del bullets[:]
+
+    def discard(self, bullets, indices):
+        """
+        Remove bullets[i] for each i in ascending `indices` in place and return
+        them to the pool. Survivors keep their order (collision and DODGE
+        depend on firing order), and no new list is built.
+        """
+        removed = iter(indices)
+        skip = next(removed, None)
+        if skip is None:
+            return
+        write = skip
+        for read in range(skip, len(bullets)):
+            if read == skip:
+                self.free.append(bullets[read])
+                skip = next(removed, None)
+            else:
+                bullets[write] = bullets[read]
+                write += 1
+        del bullets[write:]
+
+    def reclaim(self, owners):
+        """Take back the bullets of players/enemies that are being discarded"""
+        for owner in owners:
+            if isinstance(owner.bullets, list):
+                self.release_all(owner.bullets)
+
+    @property
+    def in_use(self):
+        return self.allocated - len(self.free)
+
+    def stats(self):
+        """Occupancy: dicts created, in flight, free, most ever in flight, total fired"""
+        return {
+            "allocated": self.allocated,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "peak": self.peak,
+            "acquired": self.acquired,
+        }
+
+
+# Shared by Player.shoot and the enemy bullet factories
+bullet_pool = BulletPool()
@@ -15,4 +15,6 @@ GRAY = (180, 180, 180)  # or any shade you prefer
 
 # Game settings
 FPS = 60
-clock = pygame.time.Clock()
\ No newline at end of file
+clock = pygame.time.Clock()
+# Redraw and present only the changed parts of the screen (render.DirtyRectRenderer)
+DIRTY_RECTS = False
@@ -0,0 +1,171 @@
+"""
+Per-behavior movement handlers, and a compiler that turns an enemy's set of
+active behaviors into one movement function for Enemy.get_behavior_vector
+"""
+
+import math
+from behavior_gene import BehaviorGene
+from enemy.lookup_tables import PHASE_FRAMES, ZIGZAG_SIN, ZIGZAG_RATE, CIRCLE_COS, CIRCLE_SIN, CIRCLE_RATE
+
+STOP = BehaviorGene.STOP.value
+
+# Handlers take (enemy, player, index, dx, dy, distance, vf): the unit vector
+# and distance to the player and this behavior's variance factor
+
+
+def aggressive(enemy, player, index, dx, dy, distance, vf):
+    return dx * vf, dy * vf
+
+
+def defensive(enemy, player, index, dx, dy, distance, vf):
+    ideal_distance = 200
+    if distance < ideal_distance:
+        return -dx * 0.5 * vf, -dy * 0.5 * vf
+    elif distance > ideal_distance + 50:
+        return dx * 0.3 * vf, dy * 0.3 * vf
+    return 0, 0.1  # Slight drift
+
+
+def tactical(enemy, player, index, dx, dy, distance, vf):
+    # Perpendicular to player direction = flanking
+    return -dy * 0.6 * vf, dx * 0.6 * vf
+
+
+def kamikaze(enemy, player, index, dx, dy, distance, vf):
+    return dx * 1.5 * vf, dy * 1.5 * vf
+
+
+def zigzag(enemy, player, index, dx, dy, distance, vf):
+    t = enemy.time_alive
+    phase = ZIGZAG_SIN[t] if t < PHASE_FRAMES else math.sin(t * ZIGZAG_RATE)
+    return phase * vf, 0.5
+
+
+def circle(enemy, player, index, dx, dy, distance, vf):
+    t = enemy.time_alive
+    if t < PHASE_FRAMES:
+        return CIRCLE_COS[t] * vf, CIRCLE_SIN[t] * vf
+    angle = t * CIRCLE_RATE
+    return math.cos(angle) * vf, math.sin(angle) * vf
+
+
+def stop(enemy, player, index, dx, dy, distance, vf):
+    return 0, 0
+
+
+def dodge(enemy, player, index, dx, dy, distance, vf):
+    closest_bullet = None
+    closest_dist = float('inf')
+    bullets = player.bullets if index is None else index.player_bullets.query(enemy.x, enemy.y, 150)
+    for bullet in bullets:
+        bdx = bullet['x'] - enemy.x
+        bdy = bullet['y'] - enemy.y
+        dist = math.sqrt(bdx**2 + bdy**2)
+        if dist < closest_dist:
+            closest_dist = dist
+            closest_bullet = bullet
+    if closest_bullet and closest_dist < 150:
+        # Dodge relative to the last bullet fired, whichever is closest
+        last_bullet = player.bullets[-1]
+        dodge_x = -(last_bullet['y'] - enemy.y)
+        dodge_y = last_bullet['x'] - enemy.x
+        return dodge_x * vf, dodge_y * vf
+    return enemy.rng.uniform(-0.3, 0.3), 0.3
+
+
+def ambush(enemy, player, index, dx, dy, distance, vf):
+    if enemy.y < player.y - 150:
+        return dx * 0.5 * vf, 0.1
+    return 0, -0.5
+
+
+def drift(enemy, player, index, dx, dy, distance, vf):
+    return 0, 0.5  # Slight downward drift
+
+
+HANDLERS = {
+    BehaviorGene.AGGRESSIVE.value: aggressive,
+    BehaviorGene.DEFENSIVE.value: defensive,
+    BehaviorGene.TACTICAL.value: tactical,
+    BehaviorGene.KAMIKAZE.value: kamikaze,
+    BehaviorGene.ZIGZAG.value: zigzag,
+    BehaviorGene.CIRCLE.value: circle,
+    STOP: stop,
+    BehaviorGene.DODGE.value: dodge,
+    BehaviorGene.AMBUSH.value: ambush,
+}
+
+# Behaviors whose handler uses the direction to the player
+AIMED = {
+    BehaviorGene.AGGRESSIVE.value, BehaviorGene.DEFENSIVE.value, BehaviorGene.TACTICAL.value,
+    BehaviorGene.KAMIKAZE.value, BehaviorGene.AMBUSH.value,
+}
+
+_compiled = {}
+
+
+def handler(behavior_id):
+    """Movement influence of one behavior; unlisted behaviors drift down"""
+    return HANDLERS.get(behavior_id, drift)
+
+
+def player_direction(enemy, player):
+    """Unit vector and distance (at least 1) from the enemy to the player"""
+    dx = player.x - enemy.x
+    dy = player.y - enemy.y
+    distance = max(1, math.sqrt(dx * dx + dy * dy))
+    return dx / distance, dy / distance, distance
+
+
+def behavior_mask(behaviors):
+    mask = 0
+    for behavior in behaviors:
+        mask |= 1 << behavior
+    return mask
+
+
+def _no_movement(enemy, player, index=None):
+    return 0, 0
+
+
+def _build(behaviors):
+    weight = 1.0 / len(behaviors)
+    # STOP adds nothing, but still takes its variance draw like every other
+    # behavior so seeded runs do not depend on how the movement is evaluated
+    handlers = tuple(None if behavior == STOP else handler(behavior) for behavior in behaviors)
+    aimed = any(behavior in AIMED for behavior in behaviors)
+
+    def movement(enemy, player, index=None):
+        if aimed:
+            dx, dy, distance = player_direction(enemy, player)
+        else:
+            dx = dy = 0.0
+            distance = 1
+        uniform = enemy.rng.uniform
+        phenotype = enemy.phenotype
+        low, high = phenotype.variance_low, phenotype.variance_high
+
+        move_x, move_y = 0, 0
+        for influence in handlers:
+            vf = uniform(low, high)
+            if influence is None:
+                continue
+            influence_x, influence_y = influence(enemy, player, index, dx, dy, distance, vf)
+            move_x += influence_x * weight
+            move_y += influence_y * weight
+        return move_x, move_y
+
+    return movement
+
+
+def compile_behaviors(behaviors):
+    """
+    Weighted movement function (enemy, player, index) for this sequence of
+    active behavior ids, equivalent to Enemy.get_behavior_vector. Compiled
+    once per behavior bitmask per process.
+    """
+    mask = behavior_mask(behaviors)
+    movement = _compiled.get(mask)
+    if movement is None:
+        movement = _compiled[mask] = _build(tuple(sorted(behaviors))) if behaviors else _no_movement
+    return movement
@@ -1,9 +1,9 @@
 import random
 import math
 
-def compute_bullet_accuracy(dx, dy, accuracy):
-    dx += random.uniform(-0.5, 0.5) * (1 - accuracy)
-    dy += random.uniform(-0.5, 0.5) * (1 - accuracy)
+def compute_bullet_accuracy(dx, dy, accuracy, rng=random):
+    dx += rng.uniform(-0.5, 0.5) * (1 - accuracy)
+    dy += rng.uniform(-0.5, 0.5) * (1 - accuracy)
     length = math.sqrt(dx * dx + dy * dy)
     return (dx / length), (dy / length)
 
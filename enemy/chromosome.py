@@ -0,0 +1,115 @@
+"""
+Fixed-length chromosome: 60 genes in one contiguous float64 buffer
+"""
+
+from array import array
+import numpy as np
+from enemy.gene_index import GeneIndex
+
+GENE_COUNT = 60
+
+
+class Chromosome:
+    """
+    Dense replacement for the old int-keyed gene dicts. Genes that sparse
+    dicts left out (2, 6-9, 19, 44, 48-51 in fresh enemies) read as 0, which
+    is what every consumer already assumed via .get(i, 0).
+
+    Supports the dict operations the rest of the code uses (indexing, get,
+    in, items, copy) plus GeneIndex-named properties such as
+    chromosome.speed. The buffer is either a standalone array('d') or a
+    memoryview onto a row of a population matrix (see from_matrix).
+
+    `version` counts gene assignments through the chromosome, so compiled
+    views such as Enemy.phenotype can tell when they are stale. Writes
+    straight into the buffer or the matrix behind it are not counted.
+    """
+
+    __slots__ = ("genes", "version")
+
+    def __init__(self, genes=None):
+        self.version = 0
+        if genes is None:
+            self.genes = array('d', bytes(8 * GENE_COUNT))
+        elif isinstance(genes, Chromosome):
+            self.genes = array('d', genes.genes.tobytes())
+        elif hasattr(genes, "items"):
+            self.genes = array('d', bytes(8 * GENE_COUNT))
+            for i, value in genes.items():
+                self.genes[int(i)] = value
+        else:
+            # Any float64 buffer of length 60: array('d'), memoryview or ndarray row
+            self.genes = genes if isinstance(genes, (array, memoryview)) else memoryview(genes)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Wrap every row of an (N, 60) float64 matrix without copying"""
+        return [cls(memoryview(row)) for row in matrix]
+
+    def to_array(self):
+        """Zero-copy NumPy view of the genes"""
+        return np.frombuffer(self.genes, dtype=np.float64)
+
+    def copy(self):
+        return Chromosome(self)
+
+    def __getitem__(self, i):
+        return self.genes[i]
+
+    def __setitem__(self, i, value):
+        self.genes[i] = value
+        self.version += 1
+
+    def get(self, i, default=None):
+        return self.genes[i] if 0 <= i < GENE_COUNT else default
+
+    def __contains__(self, i):
+        return 0 <= i < GENE_COUNT
+
+    def __len__(self):
+        return GENE_COUNT
+
+    def __iter__(self):
+        return iter(range(GENE_COUNT))
+
+    def keys(self):
+        return range(GENE_COUNT)
+
+    def values(self):
+        return list(self.genes)
+
+    def items(self):
+        return zip(range(GENE_COUNT), self.genes)
+
+    def __eq__(self, other):
+        if isinstance(other, Chromosome):
+            return self.genes.tobytes() == other.genes.tobytes()
+        return NotImplemented
+
+    def __reduce__(self):
+        return (Chromosome, (array('d', self.genes.tobytes()),))
+
+    def __repr__(self):
+        return f"Chromosome({list(self.genes)})"
+
+
+def _gene_property(index):
+    def getter(self):
+        return self.genes[index]
+
+    def setter(self, value):
+        self[index] = value
+
+    return property(getter, setter)
+
+
+for _gene in GeneIndex:
+    setattr(Chromosome, _gene.name.lower(), _gene_property(_gene.value))
+
+
+def population_matrix(chromosomes):
+    """Stack chromosomes into one (N, 60) float64 matrix"""
+    if not chromosomes:
+        return np.zeros((0, GENE_COUNT))
+    return np.stack([c.to_array() if isinstance(c, Chromosome) else Chromosome(c).to_array()
+                     for c in chromosomes])
@@ -4,28 +4,37 @@ import math
 from constants import *
 from behavior_gene import BehaviorGene
 from enemy.enemy_group import apply_group_behavior
-from enemy.gene_index import GeneIndex
-from enemy.enemy_bullet import create_bullet,get_bullet_size_from_bias  # Make sure this import is at the top
+from enemy.chromosome import Chromosome
+from enemy.enemy_bullet import get_bullet_size_from_bias
+from enemy.phenotype import Phenotype
+from enemy.behavior_compiler import handler, player_direction
+from enemy.firing import BURST, BURST_SHOTS, BURST_INTERVAL, choose_pattern, fire, fire_burst_shot
 from enemy.enemy_fitness import calculate_enemy_fitness
+from render import bullet_sprites
+from bullet_pool import bullet_pool
+from world.collision import box_overlap
 
 class Enemy:
-    def __init__(self, screen, chromosome=None):
+    def __init__(self, screen, chromosome=None, rng=None):
         
         ## Logging
         self.behavior_log = []  # Stores timestamped behavior changes
 
+        # Source of randomness: any object with the `random` module API, e.g. a
+        # seeded random.Random stream from simulation.rng; defaults to `random`
+        self.rng = rng if rng is not None else random
+
         self.screen = screen
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, 100)
+        self.x = 0  # Placed by respawn() once the chromosome is known
+        self.y = 0
         self.width = 25
         self.height = 25
-        self.speed = 1.2  
         self.health = 1
         self.max_health = 1
-        self.bullet_speed = 3  
         self.bullets = []
         self.bullet_cooldown = 0
-        self.bullet_cooldown_max = 90 
+        self.burst_left = 0  # Follow-up shots of the current burst
+        self.burst_timer = 0
         self.color = RED
         self.alive = True
         self.damage_dealt = 0
@@ -36,70 +45,65 @@ class Enemy:
         self.fitness = 0
         self.last_pos = (self.x, self.y)
         
-        self.id = random.randint(0, 1000)
+        self.id = self.rng.randint(0, 1000)
         
         self.current_behavior_index = 0
         self.behavior_timer = 0
         self.current_behavior_id = BehaviorGene.AGGRESSIVE.value 
         
         if chromosome is None:
-            self.chromosome = {
+            self.chromosome = Chromosome({
     # Behavior genes (binary on/off)
-    0: random.uniform(0, 1),  # Aggressive behavior
-    1: random.uniform(0, 1),  # Defensive behavior
-    3: random.uniform(0, 1),  # Tactical positioning
+    0: self.rng.uniform(0, 1),  # Aggressive behavior
+    1: self.rng.uniform(0, 1),  # Defensive behavior
+    3: self.rng.uniform(0, 1),  # Tactical positioning
     4: 1,  # Kamikaze behavior
-    5: random.uniform(0, 1),  # Adaptive behavior
-    10: random.uniform(0, 1),  # Zigzag pattern
-    11: random.uniform(0, 1),  # Circle pattern
-    12: random.uniform(0, 1),  # Stop temporarily
-    13: random.uniform(0, 1),  # Shoot straight
-    14: random.uniform(0, 1),  # Shoot spread
-    15: random.uniform(0, 1),  # Shoot burst
-    16: random.uniform(0, 1),  # Dodge
-    18: random.uniform(0, 1),  # Ambush
+    5: self.rng.uniform(0, 1),  # Adaptive behavior
+    10: self.rng.uniform(0, 1),  # Zigzag pattern
+    11: self.rng.uniform(0, 1),  # Circle pattern
+    12: self.rng.uniform(0, 1),  # Stop temporarily
+    13: self.rng.uniform(0, 1),  # Shoot straight
+    14: self.rng.uniform(0, 1),  # Shoot spread
+    15: self.rng.uniform(0, 1),  # Shoot burst
+    16: self.rng.uniform(0, 1),  # Dodge
+    18: self.rng.uniform(0, 1),  # Ambush
 
     # Attribute modifiers
-    40: random.uniform(0.5, 3.0),  # Speed modifier
-    41: random.uniform(0.5, 2.0),  # Fire rate modifier
-    42: random.uniform(0.5, 1.0),  # Accuracy modifier
-    43: random.uniform(0.5, 1.0),  # Evasion modifier
-    45: random.uniform(0.8, 1.5),  # Bullet speed modifier
-    46: random.uniform(0.8, 2.0),  # Bullet damage modifier
+    40: self.rng.uniform(0.5, 3.0),  # Speed modifier
+    41: self.rng.uniform(0.5, 2.0),  # Fire rate modifier
+    42: self.rng.uniform(0.5, 1.0),  # Accuracy modifier
+    43: self.rng.uniform(0.5, 1.0),  # Evasion modifier
+    45: self.rng.uniform(0.8, 1.5),  # Bullet speed modifier
+    46: self.rng.uniform(0.8, 2.0),  # Bullet damage modifier
 
     # Bullet size (reduced to a single gene)
-    47: random.uniform(0, 1),  # Bullet size probability
+    47: self.rng.uniform(0, 1),  # Bullet size probability
 
     # Formation / Pattern stuff
-    52: random.uniform(-50, 50),  # Spawn X offset
-    53: random.uniform(0.1, 1.0),  # Pattern variance
+    52: self.rng.uniform(-50, 50),  # Spawn X offset
+    53: self.rng.uniform(0.1, 1.0),  # Pattern variance
 
     # Group dynamics
-    17: random.betavariate(2, 5),  # Group with other enemies
+    17: self.rng.betavariate(2, 5),  # Group with other enemies
 
-    54: random.uniform(1, 10),     # Group size preference (1-10 enemies)
-    55: random.uniform(30, 200),   # Optimal proximity
-    56: random.uniform(0, 1),      # Formation role
-    57: random.randint(0, 3),      # Formation pattern
-    58: random.uniform(0, 1),      # Group synchronization
+    54: self.rng.uniform(1, 10),     # Group size preference (1-10 enemies)
+    55: self.rng.uniform(30, 200),   # Optimal proximity
+    56: self.rng.uniform(0, 1),      # Formation role
+    57: self.rng.randint(0, 3),      # Formation pattern
+    58: self.rng.uniform(0, 1),      # Group synchronization
 
     59: 0.0  # Fitness
-}
+})
 
 
-        else:
+        elif isinstance(chromosome, Chromosome):
             self.chromosome = chromosome
+        else:
+            self.chromosome = Chromosome(chromosome)
         
-        # Apply genetic traits to enemy attributes
-        self.speed *= self.chromosome[GeneIndex.SPEED]
-        self.bullet_cooldown_max = int(self.bullet_cooldown_max / self.chromosome[41])
-        self.bullet_speed *= self.chromosome[GeneIndex.BULLET_SPEED]
-       
         self.max_health = self.health
         
-        # Apply spawn offset for formation variety
-        self.x += self.chromosome[52]
-        self.x = max(0, min(SCREEN_WIDTH - self.width, self.x))
+        self.respawn()
         
         # Create a color based on the primary behaviors
         r = int(min(255, 128 + (self.chromosome[0] + self.chromosome[4]) * 30))
@@ -107,32 +111,70 @@ class Enemy:
         b = int(min(255, 128 + (self.chromosome[3] + self.chromosome[11]) * 30))
         self.color = (r, g, b)
 
+    @property
+    def chromosome(self):
+        return self._chromosome
+
+    @chromosome.setter
+    def chromosome(self, chromosome):
+        self._chromosome = chromosome
+        self.compile_phenotype()
+
+    @property
+    def phenotype(self):
+        """Derived stats of the chromosome, recompiled after its genes are edited"""
+        phenotype = self._phenotype
+        if phenotype.version != self._chromosome.version:
+            phenotype = self.compile_phenotype()
+        return phenotype
+
+    def compile_phenotype(self):
+        """Re-derive the phenotype from the chromosome; needed after writing to its gene matrix directly"""
+        self._phenotype = Phenotype(self._chromosome)
+        return self._phenotype
+
+    # Attribute genes applied to the base stats
+    @property
+    def speed(self):
+        return self.phenotype.speed
+
+    @property
+    def bullet_speed(self):
+        return self.phenotype.bullet_speed
+
+    @property
+    def bullet_cooldown_max(self):
+        return self.phenotype.bullet_cooldown_max
+
+    def respawn(self):
+        """Draw a spawn point from self.rng near the top of the screen"""
+        self.x = self.rng.randint(0, SCREEN_WIDTH)
+        self.y = self.rng.randint(0, 100)
+
+        # Apply spawn offset for formation variety
+        self.x += self.chromosome[52]
+        self.x = max(0, min(SCREEN_WIDTH - self.width, self.x))
+        self.last_pos = (self.x, self.y)
     
     def get_random_bullet_size(self):
-        bullet_bias = self.chromosome[47]  # Single gene for bullet size bias
-        return get_bullet_size_from_bias(bullet_bias)
+        return get_bullet_size_from_bias(self.phenotype.bullet_size_bias, self.rng)
    
-    def move(self, player, all_enemies=None):
+    def move(self, player, all_enemies=None, index=None):
         previous_x, previous_y = self.x, self.y
+        phenotype = self.phenotype
 
-        # Step 1: Evaluate all active behaviors and their weights
-        behavior_weights = self.evaluate_behavior_weights(player, all_enemies)
-
-        # Step 2: Get the net movement vector based on weighted behaviors
-        
-        
-        indiv_x, indiv_y = self.get_behavior_vector(player, all_enemies)
-        group_x, group_y = apply_group_behavior(self, all_enemies)
-        group_weight = self.chromosome.get(GeneIndex.GROUP, 0.0)  # Previously a binary flag, now interpreted as weight
+        # Net movement vector of the weighted active behaviors
+        indiv_x, indiv_y = self.get_behavior_vector(player, all_enemies, index)
+        group_x, group_y = apply_group_behavior(self, all_enemies, index)
+        group_weight = phenotype.group_weight  # Previously a binary flag, now interpreted as weight
         # Final blended movement vector
         final_x = indiv_x * (1 - group_weight) + group_x * group_weight
         final_y = indiv_y * (1 - group_weight) + group_y * group_weight
-        variance = self.chromosome.get(GeneIndex.BEHAVIOR_VARIANCE, 0.5)
-        variance_factor = random.uniform(1 - variance, 1 + variance)
+        variance_factor = self.rng.uniform(phenotype.variance_low, phenotype.variance_high)
 
         move_length = max(0.1, math.sqrt(final_x**2 + final_y**2))
-        move_x = (final_x / move_length) * self.speed * variance_factor
-        move_y = (final_y / move_length) * self.speed * variance_factor
+        move_x = (final_x / move_length) * phenotype.speed * variance_factor
+        move_y = (final_y / move_length) * phenotype.speed * variance_factor
 
       
         self.x += move_x
@@ -148,43 +190,28 @@ class Enemy:
 
     
     def shoot(self, player):
+        """Scalar firing path; FiringScheduler does the same for a whole population"""
+        if self.burst_left > 0:
+            self.burst_timer -= 1
+            if self.burst_timer <= 0:
+                fire_burst_shot(self, player)
+                self.burst_left -= 1
+                self.burst_timer = BURST_INTERVAL
+
         if self.bullet_cooldown > 0:
             self.bullet_cooldown -= 1
             return
 
-        behavior_id = self.current_behavior_id
-
-        # Skip dedicated shooting behaviors (those handled in move)
-        if behavior_id in [BehaviorGene.SHOOT_STRAIGHT.value, 
-                        BehaviorGene.SHOOT_SPREAD.value, 
-                        BehaviorGene.SHOOT_BURST.value]:
-            return
-
-        # Bullet size from gene bias
-        bullet_size = get_bullet_size_from_bias(self.chromosome[47])
-
-        # Adjust speed for large bullets
-        speed_multiplier = max(0.5, 1.0 + (1.0 - bullet_size))
-
-        # Accuracy penalty if moving
-        base_accuracy = self.chromosome[42]
-        if getattr(self, "is_moving", False):
-            accuracy = base_accuracy * 0.8
-        else:
-            accuracy = base_accuracy
-
-        # Create bullet and fire
-        #todo: reduce acc whille moving
-        bullet = create_bullet(self, player, bullet_size, speed_multiplier)
-        self.bullets.append(bullet)
-
-        # Reload time scaled by bullet size
-        reload_multiplier = 0.7 + (bullet_size * 0.6)
-        self.bullet_cooldown = int(self.bullet_cooldown_max * reload_multiplier)
-        self.shots_fired += 1
+        pattern = choose_pattern(self)
+        self.bullet_cooldown = fire(self, player, pattern)
+        if pattern == BURST:
+            self.burst_left = BURST_SHOTS - 1
+            self.burst_timer = BURST_INTERVAL
    
     def update_bullets(self, player):
         bullets_to_remove = []
+        damage = self.phenotype.damage_per_hit
+        px, py, pw, ph = player.x, player.y, player.width, player.height
         
         for i, bullet in enumerate(self.bullets):
             # Move bullet
@@ -197,22 +224,19 @@ class Enemy:
                 bullets_to_remove.append(i)
                 continue
             
-            # Check collision with player
-            if (bullet['x'] < player.x + player.width and
-                bullet['x'] + bullet['width'] > player.x and
-                bullet['y'] < player.y + player.height and
-                bullet['y'] + bullet['height'] > player.y):
+            # Check collision with player; one target, so the scalar test
+            # beats building arrays for find_hits
+            if box_overlap(bullet['x'], bullet['y'], bullet['width'], bullet['height'], px, py, pw, ph):
                 
                 # Hit player
-                player.take_damage(10 * self.chromosome[46])  # Apply bullet damage modifier
+                player.take_damage(damage)  # Bullet damage modifier applied
                 bullets_to_remove.append(i)
-                self.damage_dealt += 10 * self.chromosome[46]
+                self.damage_dealt += damage
                 self.hits_scored += 1
         
-        # Remove bullets marked for deletion (in reverse order to avoid index issues)
-        for i in sorted(bullets_to_remove, reverse=True):
-            if i < len(self.bullets):
-                self.bullets.pop(i)
+        # Remove bullets marked for deletion in one pass, back into the pool
+        if bullets_to_remove:
+            bullet_pool.discard(self.bullets, bullets_to_remove)
     
     def take_damage(self, amount):
         """Handle enemy taking damage"""
@@ -233,9 +257,7 @@ class Enemy:
         pygame.draw.rect(self.screen, GREEN, (self.x, self.y - 10, health_bar_width, 5))
         
         # Draw bullets
-        for bullet in self.bullets:
-            pygame.draw.rect(self.screen, YELLOW, 
-                           (bullet['x'], bullet['y'], bullet['width'], bullet['height']))
+        bullet_sprites.draw(self.screen, self.bullets, YELLOW)
     
     def calculate_fitness(self):
         # Import the function to avoid circular imports
@@ -243,149 +265,15 @@ class Enemy:
     
 
     def evaluate_behavior_weights(self, player, all_enemies=None):
-        weights = {}
-
-        for i in range(20):
-            if self.chromosome.get(i, 0) == 1:
-                weight = 1.0  # default
-                #if player is not None:
-                    # if i == BehaviorGene.DEFENSIVE.value:
-                    #     dx = player.x - self.x
-                    #     dy = player.y - self.y
-                    #     dist = math.sqrt(dx**2 + dy**2)
-                    #     if dist < 200:
-                    #         weight += 1.0  
-
-                    
-
-                weights[i] = weight
-
-        return weights
+        return self.phenotype.behavior_weights()
 
     
-    def get_behavior_vector(self, player, all_enemies=None):
-        behavior_weights = self.evaluate_behavior_weights(player, all_enemies)
-        
-        total_weight = sum(behavior_weights.values())
-        if total_weight == 0:
-            return 0, 0  # No active behaviors
-
-        move_x, move_y = 0, 0
-
-        for behavior_id, weight in behavior_weights.items():
-            influence_x, influence_y = self.get_movement_influence(behavior_id, player, all_enemies)
-            move_x += influence_x * (weight / total_weight)
-            move_y += influence_y * (weight / total_weight)
-
-        return move_x, move_y
+    def get_behavior_vector(self, player, all_enemies=None, index=None):
+        return self.phenotype.movement(self, player, index)
     
     
-    def get_movement_influence(self, behavior_id, player, all_enemies=None):
-        
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = max(1, math.sqrt(dx * dx + dy * dy))
-        dx /= distance
-        dy /= distance
-
-        variance = self.chromosome[53]  # Pattern variance gene
-        variance_factor = random.uniform(1 - variance, 1 + variance)
-
-        if behavior_id == BehaviorGene.AGGRESSIVE.value:
-            return dx * variance_factor, dy * variance_factor
-
-        elif behavior_id == BehaviorGene.DEFENSIVE.value:
-            ideal_distance = 200
-            if distance < ideal_distance:
-                return -dx * 0.5 * variance_factor, -dy * 0.5 * variance_factor
-            elif distance > ideal_distance + 50:
-                return dx * 0.3 * variance_factor, dy * 0.3 * variance_factor
-            else:
-                return 0, 0.1  # Slight drift
-
-        elif behavior_id == BehaviorGene.TACTICAL.value:
-            # Perpendicular to player direction = flanking
-            return -dy * 0.6 * variance_factor, dx * 0.6 * variance_factor
-
-        elif behavior_id == BehaviorGene.KAMIKAZE.value:
-            return dx * 1.5 * variance_factor, dy * 1.5 * variance_factor
-
-        # elif behavior_id == BehaviorGene.ADAPTIVE.value:
-        #     health_percent = self.health / self.max_health
-        #     if health_percent < 0.3:
-        #         return -dx * variance_factor, -dy * variance_factor
-        #     elif health_percent > 0.7:
-        #         return dx * 1.2 * variance_factor, dy * 1.2 * variance_factor
-        #     else:
-        #         return 0.5 * dx, 0.5 * dy
-
-        elif behavior_id == BehaviorGene.ZIGZAG.value:
-            zigzag_x = math.sin(self.time_alive * 0.1) * variance_factor
-            return zigzag_x, 0.5
-
-        elif behavior_id == BehaviorGene.CIRCLE.value:
-            angle = self.time_alive * 0.05
-            return math.cos(angle) * variance_factor, math.sin(angle) * variance_factor
-
-        elif behavior_id == BehaviorGene.STOP.value:
-            return 0, 0
-
-        elif behavior_id == BehaviorGene.DODGE.value:
-            closest_bullet = None
-            closest_dist = float('inf')
-            for bullet in player.bullets:
-                bdx = bullet['x'] - self.x
-                bdy = bullet['y'] - self.y
-                dist = math.sqrt(bdx**2 + bdy**2)
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_bullet = bullet
-            if closest_bullet and closest_dist < 150:
-                dodge_x = -bdy
-                dodge_y = bdx
-                return dodge_x * variance_factor, dodge_y * variance_factor
-            else:
-                return random.uniform(-0.3, 0.3), 0.3
-
-        elif behavior_id == BehaviorGene.AMBUSH.value:
-            if self.y < player.y - 150:
-                return dx * 0.5 * variance_factor, 0.1
-            else:
-                return 0, -0.5
-
-        # Default fallback
-        return 0, 0.5  # Slight downward drift
-   
-    def get_shooting_influence(self, player, weights):
-        """Blend shooting behaviors based on weighted influences."""
-        total_weight = sum(weights.values())
-        if total_weight == 0 or self.bullet_cooldown > 0:
-            self.bullet_cooldown -= 1
-            return
-
-        # Normalize weights
-        norm_weights = {k: v / total_weight for k, v in weights.items()}
-
-        # Accuracy penalty if moving
-        moving_penalty = 0.0
-        if self.speed > 0.1:  # optionally detect actual movement
-            moving_penalty = 1 - self.chromosome[42]  # lower accuracy if moving
-
-        # Shoot straight
-        if BehaviorGene.SHOOT_STRAIGHT.value in norm_weights:
-            prob = norm_weights[BehaviorGene.SHOOT_STRAIGHT.value]
-            if random.random() < prob:
-                self.fire_bullet(player, pattern="straight", penalty=moving_penalty)
-
-        # Shoot spread
-        if BehaviorGene.SHOOT_SPREAD.value in norm_weights:
-            prob = norm_weights[BehaviorGene.SHOOT_SPREAD.value]
-            if random.random() < prob:
-                self.fire_bullet(player, pattern="spread", penalty=moving_penalty)
-
-        # Shoot burst
-        if BehaviorGene.SHOOT_BURST.value in norm_weights:
-            prob = norm_weights[BehaviorGene.SHOOT_BURST.value]
-            if random.random() < prob:
-                for _ in range(3):  # fire 3 quick shots
-                    self.fire_bullet(player, pattern="straight", penalty=moving_penalty * 1.2)
+    def get_movement_influence(self, behavior_id, player, all_enemies=None, index=None):
+        dx, dy, distance = player_direction(self, player)
+        phenotype = self.phenotype
+        variance_factor = self.rng.uniform(phenotype.variance_low, phenotype.variance_high)
+        return handler(behavior_id)(self, player, index, dx, dy, distance, variance_factor)
@@ -5,7 +5,9 @@ Handling bullet creation and management for enemies
 import random
 import math
 from constants import *
-from enemy.gene_index import GeneIndex
+from bullet_pool import bullet_pool
+from enemy.lookup_tables import (spread_rotations, sample_bullet_size, beta_parameters,
+                                 MIN_BULLET_SIZE, BULLET_SIZE_RANGE)
 
 def create_bullet(enemy, player, bullet_size, speed_multiplier):
     """Create a new bullet aimed at the player"""
@@ -17,69 +19,62 @@ def create_bullet(enemy, player, bullet_size, speed_multiplier):
     dy /= distance
     
     # Apply accuracy modifier
-    accuracy = enemy.chromosome[GeneIndex.ACCURACY] 
-    dx += random.uniform(-0.5, 0.5) * (1 - accuracy)
-    dy += random.uniform(-0.5, 0.5) * (1 - accuracy)
+    phenotype = enemy.phenotype
+    accuracy = phenotype.accuracy
+    dx += enemy.rng.uniform(-0.5, 0.5) * (1 - accuracy)
+    dy += enemy.rng.uniform(-0.5, 0.5) * (1 - accuracy)
     
     # Normalize direction
     direction_length = math.sqrt(dx * dx + dy * dy)
-    dx = (dx / direction_length) * enemy.bullet_speed * speed_multiplier
-    dy = (dy / direction_length) * enemy.bullet_speed * speed_multiplier
+    dx = (dx / direction_length) * phenotype.bullet_speed * speed_multiplier
+    dy = (dy / direction_length) * phenotype.bullet_speed * speed_multiplier
     
-    return {
-        'x': enemy.x + enemy.width / 2,
-        'y': enemy.y + enemy.height / 2,
-        'dx': dx,
-        'dy': dy,
-        'width': 5 * bullet_size,
-        'height': 5 * bullet_size
-    }
+    return bullet_pool.acquire(enemy.x + enemy.width / 2, enemy.y + enemy.height / 2,
+                               dx, dy, 5 * bullet_size, 5 * bullet_size)
 
-def create_spread_bullets(enemy, player, bullet_size, speed_multiplier, angles=(-0.3, 0, 0.3)):
-    """Create multiple bullets in a spread pattern"""
-    bullets = []
-    accuracy = enemy.chromosome[GeneIndex.ACCURACY]
-    angle_deviation = random.uniform(-0.2, 0.2) * (1 - accuracy)
+def create_spread_bullets(enemy, player, bullet_size, speed_multiplier, angles=(-0.3, 0, 0.3), out=None):
+    """Create multiple bullets in a spread pattern (appended to `out` if given)"""
+    bullets = out if out is not None else []
+    phenotype = enemy.phenotype
+    accuracy = phenotype.accuracy
+    angle_deviation = enemy.rng.uniform(-0.2, 0.2) * (1 - accuracy)
 
-    for angle in angles:
-        # Calculate direction to player with spread
-        total_angle = angle + angle_deviation
+    # Direction to player, turned by the volley's deviation once; the fixed
+    # spread angles are applied from their precomputed rotations
+    dx = player.x - enemy.x
+    dy = player.y - enemy.y
+    distance = max(1, math.sqrt(dx * dx + dy * dy))
+    dx /= distance
+    dy /= distance
+    cos_d = math.cos(angle_deviation)
+    sin_d = math.sin(angle_deviation)
+    dx, dy = dx * cos_d - dy * sin_d, dx * sin_d + dy * cos_d
 
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        distance = max(1, math.sqrt(dx * dx + dy * dy))
-        dx /= distance
-        dy /= distance
-        
-        # Apply rotation for spread
-        rotated_dx = dx * math.cos(total_angle) - dy * math.sin(total_angle)
-        rotated_dy = dx * math.sin(total_angle) + dy * math.cos(total_angle)
-        
-        # Apply accuracy and speed
-        final_dx = rotated_dx * enemy.bullet_speed * speed_multiplier
-        final_dy = rotated_dy * enemy.bullet_speed * speed_multiplier
-        
-        bullets.append({
-            'x': enemy.x + enemy.width / 2,
-            'y': enemy.y + enemy.height / 2,
-            'dx': final_dx,
-            'dy': final_dy,
-            'width': 4 * bullet_size, 
-            'height': 4 * bullet_size
-        })
+    speed = phenotype.bullet_speed * speed_multiplier
+    x = enemy.x + enemy.width / 2
+    y = enemy.y + enemy.height / 2
+    for cos_a, sin_a in spread_rotations(tuple(angles)):
+        # Apply rotation for spread, then speed
+        final_dx = (dx * cos_a - dy * sin_a) * speed
+        final_dy = (dx * sin_a + dy * cos_a) * speed
+        bullets.append(bullet_pool.acquire(x, y, final_dx, final_dy, 4 * bullet_size, 4 * bullet_size))
     
     return bullets
 
 
-def get_bullet_size_from_bias(bias):
+def get_bullet_size_from_bias(bias, rng=random):
     """
     Generate a bullet size using a bias value.
     bias ≈ 0 → small bullets
     bias ≈ 1 → large bullets
     Output size is in the range [0.5, 2.0]
+
+    Biases in [0, 1] sample the precomputed inverse-CDF tables with a single
+    uniform draw; anything else draws from the exact Beta distribution.
     """
+    if 0.0 <= bias <= 1.0:
+        return sample_bullet_size(bias, rng.random())
     # Clamp bias slightly to avoid extremes in Beta distribution
-    alpha = max(0.01, 1.0 - bias + 0.1)
-    beta = max(0.01, bias + 0.1)
-    raw = random.betavariate(alpha, beta)
-    return raw * 1.5 + 0.5  # Scales result to [0.5, 2.0] range
+    alpha, beta = beta_parameters(bias)
+    raw = rng.betavariate(alpha, beta)
+    return raw * BULLET_SIZE_RANGE + MIN_BULLET_SIZE  # Scales result to [0.5, 2.0] range
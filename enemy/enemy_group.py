@@ -189,10 +189,11 @@ from constants import *
     # return move_x, move_y
 
 
-def apply_group_behavior(enemy, all_enemies):
+def apply_group_behavior(enemy, all_enemies, index=None):
     """
     Calculate movement influence based on nearby allies.
     Takes into account group size preference, proximity, formation role, and synchronization.
+    If a FrameIndex is given, only allies from nearby grid cells are scanned.
     """
 
     if not all_enemies:
@@ -204,9 +205,11 @@ def apply_group_behavior(enemy, all_enemies):
     group_sync = enemy.chromosome[58]
 
     # Get nearby allies
+    radius = optimal_proximity * 1.5
+    candidates = all_enemies if index is None else index.enemies.query(enemy.x, enemy.y, radius)
     nearby = [
-        e for e in all_enemies if e != enemy and e.alive
-        and math.hypot(e.x - enemy.x, e.y - enemy.y) < optimal_proximity * 1.5
+        e for e in candidates if e != enemy and e.alive
+        and math.hypot(e.x - enemy.x, e.y - enemy.y) < radius
     ]
 
     if not nearby:
@@ -0,0 +1,97 @@
+"""
+Enemy firing patterns (SHOOT_STRAIGHT / SHOOT_SPREAD / SHOOT_BURST) and a
+scheduler that fires the whole population once per frame
+"""
+
+import numpy as np
+from enemy.gene_index import GeneIndex
+from enemy.enemy_bullet import create_bullet, create_spread_bullets, get_bullet_size_from_bias
+from enemy.bullet_utils import bullet_speed_multiplier
+
+STRAIGHT = GeneIndex.SHOOT_STRAIGHT.value
+SPREAD = GeneIndex.SHOOT_SPREAD.value
+BURST = GeneIndex.SHOOT_BURST.value
+PATTERNS = (STRAIGHT, SPREAD, BURST)
+
+BURST_SHOTS = 3      # Shots in a burst, the first one included
+BURST_INTERVAL = 6   # Frames between two shots of a burst
+
+
+def choose_pattern(enemy):
+    """
+    Pick the pattern of the next volley. The shooting genes are read as
+    weights, like GROUP: an enemy with none of them set fires straight
+    without consuming a random draw.
+    """
+    phenotype = enemy.phenotype
+    if phenotype.pattern_total <= 0:
+        return STRAIGHT
+
+    r = enemy.rng.random() * phenotype.pattern_total
+    for pattern, weight in zip(PATTERNS, phenotype.pattern_weights):
+        r -= weight
+        if r < 0:
+            return pattern
+    return PATTERNS[-1]
+
+
+def fire(enemy, player, pattern):
+    """Fire one volley of `pattern` at the player; returns the reload time it costs"""
+    bullet_size = get_bullet_size_from_bias(enemy.phenotype.bullet_size_bias, enemy.rng)
+    speed_multiplier = bullet_speed_multiplier(bullet_size)
+
+    if pattern == SPREAD:
+        volley = create_spread_bullets(enemy, player, bullet_size, speed_multiplier)
+        enemy.bullets.extend(volley)
+        enemy.shots_fired += len(volley)
+    else:
+        enemy.bullets.append(create_bullet(enemy, player, bullet_size, speed_multiplier))
+        enemy.shots_fired += 1
+
+    return enemy.phenotype.reload_time(bullet_size)
+
+
+def fire_burst_shot(enemy, player):
+    """Follow-up shot of a burst: a straight shot that does not touch the cooldown"""
+    fire(enemy, player, STRAIGHT)
+
+
+class FiringScheduler:
+    """
+    Owns the cooldowns and pending bursts of a population and fires every
+    enemy that is due in one call per frame.
+
+    Frame for frame this matches calling Enemy.shoot on each alive enemy in
+    list order; waiting enemies are handled with array updates and never
+    visited in Python.
+    """
+
+    def __init__(self, enemies):
+        self.enemies = list(enemies)
+        self.cooldown = np.array([e.bullet_cooldown for e in self.enemies], dtype=np.int64)
+        self.burst_left = np.array([e.burst_left for e in self.enemies], dtype=np.int64)
+        self.burst_timer = np.array([e.burst_timer for e in self.enemies], dtype=np.int64)
+
+    def fire(self, player):
+        alive = np.fromiter((e.alive for e in self.enemies), dtype=bool, count=len(self.enemies))
+
+        bursting = alive & (self.burst_left > 0)
+        self.burst_timer[bursting] -= 1
+        burst_due = bursting & (self.burst_timer <= 0)
+
+        waiting = alive & (self.cooldown > 0)
+        self.cooldown[waiting] -= 1
+        ready = alive & ~waiting
+
+        for i in np.flatnonzero(burst_due | ready).tolist():
+            enemy = self.enemies[i]
+            if burst_due[i]:
+                fire_burst_shot(enemy, player)
+                self.burst_left[i] -= 1
+                self.burst_timer[i] = BURST_INTERVAL
+            if ready[i]:
+                pattern = choose_pattern(enemy)
+                self.cooldown[i] = fire(enemy, player, pattern)
+                if pattern == BURST:
+                    self.burst_left[i] = BURST_SHOTS - 1
+                    self.burst_timer[i] = BURST_INTERVAL
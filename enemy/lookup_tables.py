@@ -0,0 +1,97 @@
+"""
+Precomputed tables for the per-frame and per-shot math of enemies: movement
+phases of ZIGZAG/CIRCLE, the fixed spread angles and the beta-distributed
+bullet sizes
+"""
+
+import math
+from functools import lru_cache
+import numpy as np
+
+# Movement phases are indexed by time_alive (whole frames); the tables hold
+# the exact math.sin/math.cos values, later frames fall back to the functions
+PHASE_FRAMES = 1 << 14
+ZIGZAG_RATE = 0.1
+CIRCLE_RATE = 0.05
+ZIGZAG_SIN = [math.sin(t * ZIGZAG_RATE) for t in range(PHASE_FRAMES)]
+CIRCLE_COS = [math.cos(t * CIRCLE_RATE) for t in range(PHASE_FRAMES)]
+CIRCLE_SIN = [math.sin(t * CIRCLE_RATE) for t in range(PHASE_FRAMES)]
+# Same values for the batched movement kernel
+ZIGZAG_SIN_ARRAY = np.array(ZIGZAG_SIN)
+CIRCLE_COS_ARRAY = np.array(CIRCLE_COS)
+CIRCLE_SIN_ARRAY = np.array(CIRCLE_SIN)
+
+# Bullet sizes: inverse CDF of the bias' beta distribution at SIZE_QUANTILES
+# steps, for SIZE_BIAS_BINS + 1 evenly spaced biases in [0, 1]; a row is
+# built the first time a bias falls in its bin
+SIZE_BIAS_BINS = 256
+SIZE_QUANTILES = 256
+MIN_BULLET_SIZE = 0.5
+BULLET_SIZE_RANGE = 1.5
+
+
+def phase_table(table, time_alive, rate, func):
+    """Vectorized lookup of a phase table (one of the *_ARRAY) for an array of frame counts"""
+    frames = time_alive.astype(np.int64)
+    inside = frames < PHASE_FRAMES
+    out = np.empty(len(frames))
+    out[inside] = table[frames[inside]]
+    out[~inside] = func(time_alive[~inside] * rate)
+    return out
+
+
+@lru_cache(maxsize=None)
+def spread_rotations(angles):
+    """(cos, sin) of every angle of a spread pattern"""
+    return tuple((math.cos(angle), math.sin(angle)) for angle in angles)
+
+
+def beta_parameters(bias):
+    """Beta distribution of a bullet size bias, as in get_bullet_size_from_bias"""
+    return max(0.01, 1.0 - bias + 0.1), max(0.01, bias + 0.1)
+
+
+def _half_mass(a, b, grid):
+    """
+    Unnormalized CDF of Beta(a, b) on [0, 1/2]. Integrates over s = t**a,
+    which removes the t**(a - 1) singularity at 0.
+    """
+    s = np.linspace(0.0, 0.5 ** a, grid)
+    t = s ** (1.0 / a)
+    f = (1.0 - t) ** (b - 1.0)
+    mass = np.concatenate(([0.0], np.cumsum((f[1:] + f[:-1]) * 0.5 * np.diff(s)))) / a
+    return t, mass
+
+
+def beta_ppf(a, b, quantiles=SIZE_QUANTILES, grid=2048):
+    """Inverse CDF of Beta(a, b) at quantiles + 1 evenly spaced probabilities"""
+    left_t, left_mass = _half_mass(a, b, grid)
+    # Upper half by symmetry: mass above 1 - t of Beta(a, b) is the mass below t of Beta(b, a)
+    right_t, right_mass = _half_mass(b, a, grid)
+    total = left_mass[-1] + right_mass[-1]
+    x = np.concatenate((left_t, 1.0 - right_t[-2::-1]))
+    cdf = np.concatenate((left_mass, total - right_mass[-2::-1])) / total
+    return np.interp(np.linspace(0.0, 1.0, quantiles + 1), cdf, x)
+
+
+SIZE_TABLE = [None] * (SIZE_BIAS_BINS + 1)
+
+
+def size_row(j):
+    """Bullet sizes at every quantile for bias bin j"""
+    ppf = beta_ppf(*beta_parameters(j / SIZE_BIAS_BINS))
+    row = SIZE_TABLE[j] = (ppf * BULLET_SIZE_RANGE + MIN_BULLET_SIZE).tolist()
+    return row
+
+
+def sample_bullet_size(bias, u):
+    """
+    Bullet size for a bias in [0, 1] from one uniform draw `u` in [0, 1):
+    the nearest bias row, interpolated between quantiles
+    """
+    j = int(bias * SIZE_BIAS_BINS + 0.5)
+    row = SIZE_TABLE[j] or size_row(j)
+    pos = u * SIZE_QUANTILES
+    i = int(pos)
+    low = row[i]
+    return low + (row[i + 1] - low) * (pos - i)
@@ -0,0 +1,58 @@
+"""
+Derived per-enemy values, compiled from the chromosome so the per-frame
+and per-shot paths read plain attributes instead of genes
+"""
+
+from enemy.gene_index import GeneIndex
+from enemy.bullet_utils import bullet_reload_multiplier
+from enemy.behavior_compiler import compile_behaviors
+
+BEHAVIOR_COUNT = 20
+SHOOTING_PATTERNS = (GeneIndex.SHOOT_STRAIGHT, GeneIndex.SHOOT_SPREAD, GeneIndex.SHOOT_BURST)
+DAMAGE_PER_HIT = 10
+# Stats of an enemy with every attribute gene at 1.0
+BASE_SPEED = 1.2
+BASE_BULLET_SPEED = 3
+BASE_BULLET_COOLDOWN = 90
+
+
+class Phenotype:
+    """
+    What an enemy's genes mean for its behavior. `version` is the
+    chromosome's version it was compiled from; Enemy.phenotype recompiles
+    when the two differ.
+    """
+
+    __slots__ = ("version", "behaviors", "movement", "variance_low", "variance_high", "group_weight",
+                 "speed", "bullet_speed", "bullet_cooldown_max", "damage_per_hit", "accuracy",
+                 "bullet_size_bias", "pattern_weights", "pattern_total")
+
+    def __init__(self, chromosome):
+        self.version = chromosome.version
+
+        # Active behaviors (genes set to exactly 1), each with weight 1.0
+        self.behaviors = tuple(i for i in range(BEHAVIOR_COUNT) if chromosome.get(i, 0) == 1)
+        self.movement = compile_behaviors(self.behaviors)
+
+        # rng.uniform(variance_low, variance_high) is the per-move variance factor
+        variance = chromosome.get(GeneIndex.BEHAVIOR_VARIANCE, 0.5)
+        self.variance_low = 1 - variance
+        self.variance_high = 1 + variance
+        self.group_weight = chromosome.get(GeneIndex.GROUP, 0.0)
+
+        self.speed = BASE_SPEED * chromosome[GeneIndex.SPEED]
+        self.bullet_speed = BASE_BULLET_SPEED * chromosome[GeneIndex.BULLET_SPEED]
+        self.bullet_cooldown_max = int(BASE_BULLET_COOLDOWN / chromosome[GeneIndex.FIRE_RATE])
+        self.damage_per_hit = DAMAGE_PER_HIT * chromosome[GeneIndex.DAMAGE]
+        self.accuracy = chromosome[GeneIndex.ACCURACY]
+        self.bullet_size_bias = chromosome[GeneIndex.BULLET_SIZE_PROBABILITY]
+        self.pattern_weights = tuple(max(0.0, chromosome.get(pattern, 0.0)) for pattern in SHOOTING_PATTERNS)
+        self.pattern_total = sum(self.pattern_weights)
+
+    def behavior_weights(self):
+        """Unnormalized {behavior_id: weight}, as Enemy.evaluate_behavior_weights returns"""
+        return {behavior: 1.0 for behavior in self.behaviors}
+
+    def reload_time(self, bullet_size):
+        """Frames until the next volley after firing bullets of this size"""
+        return int(self.bullet_cooldown_max * bullet_reload_multiplier(bullet_size))
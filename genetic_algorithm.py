@@ -1,83 +1,172 @@
-import random
+import numpy as np
 from enemy import Enemy
+from enemy.chromosome import Chromosome, population_matrix
+
+# Mutation ranges for the continuous genes
+MUTATION_RANGES = {
+    40: (0.5, 3.0),     
+    41: (0.5, 2.0),     
+    42: (0.5, 1.0),     # Accuracy
+    43: (0.5, 1.0),     # Evasion
+    45: (0.8, 1.5),     # Bullet speed
+    46: (0.8, 2.0),     # Bullet damage
+    47: (0.0, 1.0),     # Bullet size bias
+    52: (-100, 100),    # Spawn X offset
+    53: (0.1, 1.0),     # Pattern variance
+    54: (1, 10),        # Group size
+    55: (30, 200),      # Proximity
+    56: (0.0, 1.0),     # Role
+    58: (0.0, 1.0),     # Group sync
+}
+RANGE_GENES = np.array(list(MUTATION_RANGES.keys()))
+RANGE_LOW = np.array([low for low, _ in MUTATION_RANGES.values()], dtype=float)
+RANGE_HIGH = np.array([high for _, high in MUTATION_RANGES.values()], dtype=float)
+
+# Used when no seeded stream (see simulation.rng) is passed in
+default_rng = np.random.default_rng()
+
+def select_parents(population, rng=None):
+    rng = rng if rng is not None else default_rng
 
-def select_parents(population):
     # Calculate total fitness
     total_fitness = sum(enemy.chromosome[59] for enemy in population)
     
     # If total fitness is 0, select randomly
     if total_fitness == 0:
-        return random.choice(population), random.choice(population)
+        return population[rng.integers(len(population))], population[rng.integers(len(population))]
     
     # Tournament selection
     tournament_size = min(4, len(population))
-    tournament1 = random.sample(population, tournament_size)
-    tournament2 = random.sample(population, tournament_size)
+    tournament1 = [population[i] for i in rng.choice(len(population), tournament_size, replace=False)]
+    tournament2 = [population[i] for i in rng.choice(len(population), tournament_size, replace=False)]
     
     parent1 = max(tournament1, key=lambda x: x.chromosome[59])
     parent2 = max(tournament2, key=lambda x: x.chromosome[59])
     
     return parent1, parent2
 
-def crossover(parent1, parent2):
-    child_chromosome = {}
+def crossover(parent1, parent2, rng=None):
+    rng = rng if rng is not None else default_rng
 
-    for i in range(59):  
-        if random.random() < 0.5:
-            child_chromosome[i] = parent1.chromosome.get(i, 0)
-        else:
-            child_chromosome[i] = parent2.chromosome.get(i, 0)
+    # Uniform crossover over genes 0-58 as a single masked copy
+    child = Chromosome()
+    genes = child.to_array()
+    take_first = rng.random(59) < 0.5
+    genes[:59] = np.where(take_first, parent1.chromosome.to_array()[:59], parent2.chromosome.to_array()[:59])
 
-    child_chromosome[59] = 0.0 
-    return child_chromosome
+    child[59] = 0.0 
+    return child
 
-def mutate(chromosome, mutation_rate):
+def mutate(chromosome, mutation_rate, rng=None):
+    rng = rng if rng is not None else default_rng
     mutated = chromosome.copy()
+    genes = mutated.to_array()
+
+    # Behavior toggles: flip
+    flip = rng.random(20) < mutation_rate
+    genes[:20][flip] = 1 - genes[:20][flip]
+
+    # Integer genes 20-39: re-roll
+    reroll = rng.random(20) < mutation_rate
+    genes[20:40][reroll] = rng.integers(30, 181, int(reroll.sum()))
 
-    for i in range(0, 20):  
-        if random.random() < mutation_rate:
-            mutated[i] = 1 - mutated.get(i, 0)
-
-    for i in range(20, 40):  
-        if random.random() < mutation_rate:
-            mutated[i] = random.randint(30, 180)
-
-    ranges = {
-        40: (0.5, 3.0),     
-        41: (0.5, 2.0),     
-        42: (0.5, 1.0),     # Accuracy
-        43: (0.5, 1.0),     # Evasion
-        45: (0.8, 1.5),     # Bullet speed
-        46: (0.8, 2.0),     # Bullet damage
-        47: (0.0, 1.0),     # Bullet size bias
-        52: (-100, 100),    # Spawn X offset
-        53: (0.1, 1.0),     # Pattern variance
-        54: (1, 10),        # Group size
-        55: (30, 200),      # Proximity
-        56: (0.0, 1.0),     # Role
-        58: (0.0, 1.0),     # Group sync
-    }
-
-    for i, (low, high) in ranges.items():
-        if random.random() < mutation_rate:
-            delta = (high - low) * 0.2
-            mutated[i] = max(low, min(high, mutated.get(i, low) + random.uniform(-delta, delta)))
+    # Continuous genes: nudge by up to 20% of their range, clamped
+    nudge = rng.random(len(RANGE_GENES)) < mutation_rate
+    idx = RANGE_GENES[nudge]
+    low, high = RANGE_LOW[nudge], RANGE_HIGH[nudge]
+    delta = (high - low) * 0.2
+    genes[idx] = np.clip(genes[idx] + rng.uniform(-delta, delta), low, high)
 
     # Special mutation for pattern (int)
-    if random.random() < mutation_rate:
-        mutated[57] = random.randint(0, 3)
+    if rng.random() < mutation_rate:
+        mutated[57] = rng.integers(0, 4)
 
     mutated[59] = 0.0  # Reset fitness
     return mutated
 
-def evolve_population(population, population_size, mutation_rate):
+def evolve_population(population, population_size, mutation_rate, rng=None):
     best = max(population, key=lambda e: e.chromosome.get(59, 0))
     new_population = [Enemy(best.screen, best.chromosome.copy())]
 
     while len(new_population) < population_size:
-        p1, p2 = select_parents(population)
-        child = crossover(p1, p2)
-        child = mutate(child, mutation_rate)
+        p1, p2 = select_parents(population, rng)
+        child = crossover(p1, p2, rng)
+        child = mutate(child, mutation_rate, rng)
         new_population.append(Enemy(p1.screen, child))
 
     return new_population
+
+
+def _tournament_winners(fitness, count, rng):
+    """Winner of `count` tournaments of min(4, N) distinct entrants each (first best on ties)"""
+    n = len(fitness)
+    size = min(4, n)
+    entrants = rng.integers(0, n, (count, size))
+    # Re-draw tournaments that picked someone twice, so entrants are distinct as in select_parents
+    while True:
+        ordered = np.sort(entrants, axis=1)
+        clash = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        if not clash.any():
+            break
+        entrants[clash] = rng.integers(0, n, (int(clash.sum()), size))
+    best = np.argmax(fitness[entrants], axis=1)
+    return entrants[np.arange(count), best]
+
+def evolve_gene_matrix(genes, population_size, mutation_rate, rng=None):
+    """
+    evolve_population on an (N, 60) gene matrix: elitism, tournament
+    selection, uniform crossover and mutation for every child at once.
+    Returns a new (population_size, 60) matrix.
+    """
+    rng = rng if rng is not None else default_rng
+    fitness = genes[:, 59]
+    n = len(genes)
+    children = population_size - 1
+
+    new_genes = np.empty((population_size, genes.shape[1]))
+    new_genes[0] = genes[np.argmax(fitness)]
+
+    # Selection
+    if fitness.sum() == 0:
+        parent1 = rng.integers(0, n, children)
+        parent2 = rng.integers(0, n, children)
+    else:
+        parent1 = _tournament_winners(fitness, children, rng)
+        parent2 = _tournament_winners(fitness, children, rng)
+
+    # Uniform crossover
+    take_first = rng.random((children, 59)) < 0.5
+    child = new_genes[1:]
+    child[:, :59] = np.where(take_first, genes[parent1, :59], genes[parent2, :59])
+
+    # Behavior toggles: flip
+    flip = rng.random((children, 20)) < mutation_rate
+    child[:, :20] = np.where(flip, 1 - child[:, :20], child[:, :20])
+
+    # Integer genes 20-39: re-roll
+    reroll = rng.random((children, 20)) < mutation_rate
+    child[:, 20:40] = np.where(reroll, rng.integers(30, 181, (children, 20)), child[:, 20:40])
+
+    # Continuous genes: nudge by up to 20% of their range, clamped
+    nudge = rng.random((children, len(RANGE_GENES))) < mutation_rate
+    delta = (RANGE_HIGH - RANGE_LOW) * 0.2
+    nudged = np.clip(child[:, RANGE_GENES] + rng.uniform(-delta, delta, (children, len(RANGE_GENES))),
+                     RANGE_LOW, RANGE_HIGH)
+    child[:, RANGE_GENES] = np.where(nudge, nudged, child[:, RANGE_GENES])
+
+    # Pattern (int)
+    repattern = rng.random(children) < mutation_rate
+    child[:, 57] = np.where(repattern, rng.integers(0, 4, children), child[:, 57])
+
+    child[:, 59] = 0.0  # Reset fitness
+    return new_genes
+
+def evolve_population_batch(population, population_size, mutation_rate, rng=None):
+    """
+    Drop-in for evolve_population built on evolve_gene_matrix. The new
+    enemies' chromosomes are views onto rows of a single gene matrix.
+    """
+    genes = population_matrix([enemy.chromosome for enemy in population])
+    new_genes = evolve_gene_matrix(genes, population_size, mutation_rate, rng)
+    screen = population[0].screen
+    return [Enemy(screen, chromosome) for chromosome in Chromosome.from_matrix(new_genes)]
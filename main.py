@@ -4,11 +4,16 @@ import math
 from constants import *
 from player import Player
 from enemy import ( Enemy)
+from enemy.firing import FiringScheduler
+from world import FrameIndex
+from bullet_pool import bullet_pool
+from render import DirtyRectRenderer
 from genetic_algorithm import evolve_population
-from ui import (show_generation_summary, show_game_over, show_info_overlay, show_enemy_info)
+from ui import (show_generation_summary, show_game_over, show_info_overlay, show_enemy_info, show_profiler_panel)
+from ui.text_cache import get_font, render_text
 from menu import show_main_menu, show_help_screen, show_settings_screen
-#
-# from visibility.visibility_logger import log_generation
+from visibility.visibility_logger import log_generation
+from visibility.frame_profiler import FrameProfiler
 # Initialize pygame
 pygame.init()
 
@@ -17,8 +22,8 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Adaptive Enemy AI - Genetic Algorithm")
 
 # Font settings
-font = pygame.font.SysFont('Arial', 16)
-large_font = pygame.font.SysFont('Arial', 20)
+font = get_font('Arial', 16)
+large_font = get_font('Arial', 20)
 
 # Global game variables
 generation = 1
@@ -27,6 +32,8 @@ current_enemies = 0
 enemies_defeated = 0
 mutation_rate = 0.1
 game_difficulty = 1
+# Frame timing panel: F3 toggles it, F4 exports CSV + Chrome trace to logs/profile
+profiler = FrameProfiler()
 
 def reset_game():
     global generation, enemies_defeated, current_enemies
@@ -46,6 +53,7 @@ def main():
   
     player = Player(screen)
     enemies = [Enemy(screen) for _ in range(population_size)]
+    scheduler = FiringScheduler(enemies)
     current_enemies = len(enemies)
     
     selected_enemy = None
@@ -53,83 +61,115 @@ def main():
     special_message = ""
     special_message_time = 0
     
+    renderer = DirtyRectRenderer(screen) if DIRTY_RECTS else None
+    
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                for enemy in enemies:
-                    if (enemy.alive and
-                        mouse_pos[0] >= enemy.x and mouse_pos[0] <= enemy.x + enemy.width and
-                        mouse_pos[1] >= enemy.y and mouse_pos[1] <= enemy.y + enemy.height):
-                        selected_enemy = enemy
-                        break
-                else:
-                    selected_enemy = None
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+        with profiler.scope("input"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
                     running = False
-                elif event.key == pygame.K_m:
-                    # Increase mutation rate
-                    mutation_rate = min(1.0, mutation_rate + 0.1)
-                elif event.key == pygame.K_n:
-                    # Decrease mutation rate
-                    mutation_rate = max(0.0, mutation_rate - 0.1)
-                elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                    # Increase difficulty
-                    game_difficulty = min(3, game_difficulty + 1)
-                elif event.key == pygame.K_MINUS:
-                    # Decrease difficulty
-                    game_difficulty = max(1, game_difficulty - 1)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    for enemy in enemies:
+                        if (enemy.alive and
+                            mouse_pos[0] >= enemy.x and mouse_pos[0] <= enemy.x + enemy.width and
+                            mouse_pos[1] >= enemy.y and mouse_pos[1] <= enemy.y + enemy.height):
+                            selected_enemy = enemy
+                            break
+                    else:
+                        selected_enemy = None
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_m:
+                        # Increase mutation rate
+                        mutation_rate = min(1.0, mutation_rate + 0.1)
+                    elif event.key == pygame.K_n:
+                        # Decrease mutation rate
+                        mutation_rate = max(0.0, mutation_rate - 0.1)
+                    elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
+                        # Increase difficulty
+                        game_difficulty = min(3, game_difficulty + 1)
+                    elif event.key == pygame.K_MINUS:
+                        # Decrease difficulty
+                        game_difficulty = max(1, game_difficulty - 1)
+                    elif event.key == pygame.K_F3:
+                        profiler.toggle()
+                    elif event.key == pygame.K_F4:
+                        profiler.export()
         
         if game_state == "playing":
             # Clear screen
-            screen.fill(BLACK)
+            if renderer:
+                renderer.begin_frame()
+            else:
+                screen.fill(BLACK)
             
             # Get keyboard state
-            keys = pygame.key.get_pressed()
+            with profiler.scope("input"):
+                keys = pygame.key.get_pressed()
             
             # Update player
-            player.move(keys)
-            player.shoot(keys)
-            player.update_bullets(enemies)
-            
-            # Check for special weapon activation
-            if (keys[pygame.K_f] or keys[pygame.K_q]) and player.has_special_weapon:
-                enemies_destroyed = player.use_special_weapon(enemies)
-                if enemies_destroyed > 0:
-                    # Display message about enemies destroyed
-                    special_message = f"Ring of Fire destroyed {enemies_destroyed} enemies!"
-                    special_message_time = 120  # Display for 2 seconds
-            
-            # Update special weapon animation
-            player.update_special_weapon()
+            with profiler.scope("player"):
+                player.move(keys)
+                player.shoot(keys)
+            with profiler.scope("index"):
+                index = FrameIndex([enemy for enemy in enemies if enemy.alive])
+            with profiler.scope("player"):
+                player.update_bullets(enemies)
+                
+                # Check for special weapon activation
+                if (keys[pygame.K_f] or keys[pygame.K_q]) and player.has_special_weapon:
+                    enemies_destroyed = player.use_special_weapon(enemies)
+                    if enemies_destroyed > 0:
+                        # Display message about enemies destroyed
+                        special_message = f"Ring of Fire destroyed {enemies_destroyed} enemies!"
+                        special_message_time = 120  # Display for 2 seconds
+                
+                # Update special weapon animation
+                player.update_special_weapon()
             
-            player.draw()
+            with profiler.scope("draw"):
+                player.draw()
             
             # Update enemies
             alive_enemies = [enemy for enemy in enemies if enemy.alive]
+            with profiler.scope("index"):
+                index.index_player_bullets(player.bullets)
             for enemy in alive_enemies:
                 enemy.time_alive += 1
-                enemy.move(player, alive_enemies)  # Pass all enemies for group behavior
-                enemy.shoot(player)
-                enemy.update_bullets(player)
-                enemy.draw()
-            
-            # Draw selected enemy info
-            if selected_enemy and selected_enemy.alive:
-                mouse_pos = pygame.mouse.get_pos()
-                show_enemy_info(screen, selected_enemy, mouse_pos, font)
+                with profiler.scope("enemy_move"):
+                    enemy.move(player, alive_enemies, index)  # Pass all enemies for group behavior
+            with profiler.scope("enemy_shoot"):
+                scheduler.fire(player)
+            for enemy in alive_enemies:
+                with profiler.scope("enemy_bullets"):
+                    enemy.update_bullets(player)
+                with profiler.scope("draw"):
+                    enemy.draw()
             
-            # Show game info
-            show_info_overlay(screen, player, enemies, font, generation)
+            with profiler.scope("overlay"):
+                overlay_rects = []
+                # Draw selected enemy info
+                if selected_enemy and selected_enemy.alive:
+                    mouse_pos = pygame.mouse.get_pos()
+                    overlay_rects.append(show_enemy_info(screen, selected_enemy, mouse_pos, font))
+                
+                # Show game info
+                overlay_rects.extend(show_info_overlay(screen, player, enemies, font, generation))
+                overlay_rects.append(show_profiler_panel(screen, profiler, font))
+                
+                # Show special weapon message if active
+                if special_message_time > 0:
+                    message_text = render_text(font, special_message, YELLOW)
+                    overlay_rects.append(screen.blit(message_text, (SCREEN_WIDTH // 2 - message_text.get_width() // 2, 100)))
+                    special_message_time -= 1
             
-            # Show special weapon message if active
-            if special_message_time > 0:
-                message_text = font.render(special_message, True, YELLOW)
-                screen.blit(message_text, (SCREEN_WIDTH // 2 - message_text.get_width() // 2, 100))
-                special_message_time -= 1
+            if renderer:
+                renderer.add_player(player)
+                for enemy in alive_enemies:
+                    renderer.add_enemy(enemy)
+                renderer.extend(overlay_rects)
             
             # Check game state
             if not player.alive:
@@ -140,33 +180,48 @@ def main():
                 # Calculate fitness for all enemies
                 for enemy in enemies:
                     enemy.calculate_fitness()
+                log_generation(enemies, generation)
                 
                 # Move to next generation
                 if show_generation_summary(screen, enemies, font, large_font, generation, enemies_defeated, mutation_rate, game_difficulty):
                     # Evolve population
+                    bullet_pool.reclaim(enemies)
+                    bullet_pool.reclaim([player])
                     enemies = evolve_population(enemies, population_size, mutation_rate)
+                    scheduler = FiringScheduler(enemies)
                     
                     generation += 1
                     enemies_defeated += current_enemies
                     current_enemies = len(enemies)
-                    #log_generation(enemies, generation)
 
                     # Reset player position and health
                     player = Player(screen)
+                if renderer:
+                    renderer.invalidate()
             
             # Update display
-            pygame.display.flip()
+            with profiler.scope("flip"):
+                if renderer:
+                    renderer.end_frame()
+                else:
+                    pygame.display.flip()
             clock.tick(FPS)
+            profiler.end_frame()
         
         elif game_state == "game_over":
             # Show game over screen
             if show_game_over(screen, False, font, large_font, generation, enemies_defeated):
                 # Reset game
                 game_state = "playing"
+                if renderer:
+                    renderer.invalidate()
+                bullet_pool.reclaim(enemies)
+                bullet_pool.reclaim([player])
                 player = Player(screen)
                 # Assign a new random shooting direction
                 player.shooting_angle = random.uniform(0, 2 * math.pi)
                 enemies = [Enemy(screen) for _ in range(population_size)]
+                scheduler = FiringScheduler(enemies)
                 generation = 1
                 enemies_defeated = 0
                 current_enemies = len(enemies)
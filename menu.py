@@ -1,6 +1,7 @@
 import pygame
 import sys
 from constants import *
+from ui.text_cache import render_text
 
 def show_main_menu(screen, mutation_rate, game_difficulty, font, large_font):
     menu_running = True
@@ -18,16 +19,16 @@ def show_main_menu(screen, mutation_rate, game_difficulty, font, large_font):
         screen.fill(BLACK)
         
         # Title
-        title_text = large_font.render("Adaptive Enemy AI - Genetic Algorithm", True, WHITE)
+        title_text = render_text(large_font, "Adaptive Enemy AI - Genetic Algorithm", WHITE)
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100))
         
         # Menu options
         y_offset = 250
         for i, option in enumerate(menu_options):
             if i == selected_option:
-                text = large_font.render(f"> {option['text']} <", True, GREEN)
+                text = render_text(large_font, f"> {option['text']} <", GREEN)
             else:
-                text = large_font.render(option['text'], True, WHITE)
+                text = render_text(large_font, option['text'], WHITE)
             
             screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, y_offset))
             y_offset += 60
@@ -121,9 +122,9 @@ def show_help_screen(screen, font):
                 continue
                 
             if line.endswith(":"):  # Section header
-                text = font.render(line, True, YELLOW)
+                text = render_text(font, line, YELLOW)
             else:
-                text = font.render(line, True, WHITE)
+                text = render_text(font, line, WHITE)
             
             screen.blit(text, (50, y_offset))
             y_offset += 30
@@ -156,7 +157,7 @@ def show_settings_screen(screen, mutation_rate, game_difficulty, font, large_fon
         screen.fill(BLACK)
         
         # Title
-        title_text = large_font.render("Settings", True, WHITE)
+        title_text = render_text(large_font, "Settings", WHITE)
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100))
         
         # Settings options
@@ -167,15 +168,15 @@ def show_settings_screen(screen, mutation_rate, game_difficulty, font, large_fon
             
             # Highlight selected setting
             if i == selected_setting:
-                text = font.render(f"> {setting_text} <", True, GREEN)
+                text = render_text(font, f"> {setting_text} <", GREEN)
             else:
-                text = font.render(setting_text, True, WHITE)
+                text = render_text(font, setting_text, WHITE)
             
             screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, y_offset))
             y_offset += 50
         
         # Instructions
-        instructions_text = font.render("Use LEFT/RIGHT to adjust values, UP/DOWN to navigate, ESC to return", True, WHITE)
+        instructions_text = render_text(font, "Use LEFT/RIGHT to adjust values, UP/DOWN to navigate, ESC to return", WHITE)
         screen.blit(instructions_text, (SCREEN_WIDTH // 2 - instructions_text.get_width() // 2, SCREEN_HEIGHT - 100))
         
         # Update display
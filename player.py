@@ -1,7 +1,11 @@
 import pygame
 import math
-import random
+import numpy as np
 from constants import *
+from world.collision import find_hits
+from render import bullet_sprites, ring_of_fire
+from bullet_pool import bullet_pool
+from ui.text_cache import get_font, render_text
 
 class Player:
     def __init__(self, screen):
@@ -48,14 +52,8 @@ class Player:
             dy = math.sin(self.shooting_angle)
             
             
-            self.bullets.append({
-                'x': self.x + self.width / 2 - 2.5,
-                'y': self.y + self.height / 2,
-                'width': 5,
-                'height': 10,
-                'dx': dx * 10,
-                'dy': dy * 10
-            })
+            self.bullets.append(bullet_pool.acquire(self.x + self.width / 2 - 2.5, self.y + self.height / 2,
+                                                    dx * 10, dy * 10, 5, 10))
             
             self.bullet_cooldown = self.bullet_cooldown_max
         else:
@@ -63,6 +61,8 @@ class Player:
     
     def update_bullets(self, enemies):
         bullets_to_remove = []
+        live = []
+        live_rows = []
         
         for i, bullet in enumerate(self.bullets):
           
@@ -74,26 +74,32 @@ class Player:
                 bullet['y'] < 0 or bullet['y'] > SCREEN_HEIGHT):
                 bullets_to_remove.append(i)
                 continue
-            
-            
-            for enemy in enemies:
-                if not enemy.alive:
+            live.append(bullet)
+            live_rows.append(i)
+        
+        targets = [enemy for enemy in enemies if enemy.alive]
+        if live and targets:
+            bullet_idx, enemy_idx = find_hits(
+                np.array([(b['x'], b['y']) for b in live]), np.array([(b['width'], b['height']) for b in live]),
+                np.array([(e.x, e.y) for e in targets]), np.array([(e.width, e.height) for e in targets]))
+
+            # Pairs come ordered by bullet, then enemy: the first enemy still
+            # alive takes the hit, as in a bullet-by-bullet scan
+            spent = set()
+            for b, e in zip(bullet_idx.tolist(), enemy_idx.tolist()):
+                if b in spent:
                     continue
-                
-                if (bullet['x'] < enemy.x + enemy.width and
-                    bullet['x'] + bullet['width'] > enemy.x and
-                    bullet['y'] < enemy.y + enemy.height and
-                    bullet['y'] + bullet['height'] > enemy.y):
-                    
-                 
+                enemy = targets[e]
+                if enemy.alive:
                     enemy.take_damage(1)
-                    bullets_to_remove.append(i)
-                    break
+                    spent.add(b)
+            if spent:
+                bullets_to_remove.extend(live_rows[b] for b in spent)
+                bullets_to_remove.sort()
         
         
-        for i in sorted(bullets_to_remove, reverse=True):
-            if i < len(self.bullets):
-                self.bullets.pop(i)
+        if bullets_to_remove:
+            bullet_pool.discard(self.bullets, bullets_to_remove)
     
     def take_damage(self, amount):
         self.health -= amount
@@ -134,43 +140,15 @@ class Player:
     
     def draw_special_weapon(self):
         if self.special_weapon_active:
-          
-            alpha = int(255 * (self.special_weapon_frames / 30))
-            
-           
-            ring_surface = pygame.Surface((self.special_weapon_radius * 2, self.special_weapon_radius * 2), pygame.SRCALPHA)
-            
-         
             center_x = self.x + self.width / 2
             center_y = self.y + self.height / 2
-            
-            
-            for i in range(20):  
-                angle = random.uniform(0, math.pi * 2)
-                radius = self.special_weapon_radius * random.uniform(0.7, 1.0)
-                particle_x = self.special_weapon_radius + math.cos(angle) * radius
-                particle_y = self.special_weapon_radius + math.sin(angle) * radius
-                size = random.randint(5, 15)
-                
-                
-                color_mix = random.uniform(0, 1)
-                r = int(255)
-                g = int(255 * (1 - color_mix))
-                b = 0
-                
-                pygame.draw.circle(ring_surface, (r, g, b, alpha), (particle_x, particle_y), size)
-            
-            
-            pygame.draw.circle(ring_surface, (255, 100, 0, alpha), (self.special_weapon_radius, self.special_weapon_radius), self.special_weapon_radius, 3)
-            
-           
-            self.screen.blit(ring_surface, (center_x - self.special_weapon_radius, center_y - self.special_weapon_radius))
+            ring_of_fire(self.special_weapon_radius).draw(self.screen, center_x, center_y, self.special_weapon_frames)
     
     def draw_special_weapon_indicator(self):
        
         if self.has_special_weapon:
             pygame.draw.circle(self.screen, (255, 200, 0), (30, SCREEN_HEIGHT - 30), 10)
-            text = pygame.font.SysFont('Arial', 20).render("F/Q", True, BLACK)
+            text = render_text(get_font('Arial', 20), "F/Q", BLACK)
             self.screen.blit(text, (20, SCREEN_HEIGHT - 36))
     
     def draw(self):
@@ -193,18 +171,7 @@ class Player:
         pygame.draw.rect(self.screen, RED, (self.x, self.y - 15, self.width, 10))
         pygame.draw.rect(self.screen, GREEN, (self.x, self.y - 15, health_bar_width, 10))
         
-        for bullet in self.bullets:
-            angle = math.atan2(bullet['dy'], bullet['dx'])
-            
-            bullet_surface = pygame.Surface((bullet['width'], bullet['height']), pygame.SRCALPHA)
-            pygame.draw.rect(bullet_surface, GREEN, (0, 0, bullet['width'], bullet['height']))
-            
-            rotated_surface = pygame.transform.rotate(bullet_surface, -math.degrees(angle) + 90)
-            
-            bullet_rect = rotated_surface.get_rect(center=(bullet['x'] + bullet['width']//2, 
-                                                          bullet['y'] + bullet['height']//2))
-            
-            self.screen.blit(rotated_surface, bullet_rect)
+        bullet_sprites.draw_rotated(self.screen, self.bullets, GREEN)
         
         self.draw_special_weapon()
         
@@ -0,0 +1,13 @@
+# render/__init__.py
+
+from .bullet_sprites import BulletSprites, bullet_sprites
+from .ring_of_fire import RingOfFire, ring_of_fire
+from .dirty_rects import DirtyRectRenderer
+
+__all__ = [
+    "BulletSprites",
+    "bullet_sprites",
+    "RingOfFire",
+    "ring_of_fire",
+    "DirtyRectRenderer",
+]
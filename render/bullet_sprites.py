@@ -0,0 +1,64 @@
+"""
+Bullet rendering without per-bullet Surfaces. Rotated bullets are
+rendered once per distinct (size, color, heading) and a frame's bullets
+go out in one Surface.blits call. Axis-aligned bullets are plain fills,
+which already allocate nothing and beat blitting a cached sprite.
+"""
+
+import math
+import pygame
+
+# Rotations are cached at 1 degree steps
+ANGLE_STEPS = 360
+
+
+def _round(value):
+    """Round half away from zero, like pygame.Rect does for float centers"""
+    return int(value + 0.5) if value >= 0 else -int(0.5 - value)
+
+
+class BulletSprites:
+    def __init__(self, angle_steps=ANGLE_STEPS):
+        self.angle_steps = angle_steps
+        self.rotated = {}  # (width, height, color, step) -> (Surface, half_width, half_height)
+
+    def rotated_sprite(self, width, height, color, step):
+        """A width x height rect rotated to heading `step` (of angle_steps), as drawn by the old per-bullet path"""
+        key = (int(width), int(height), color, step)
+        entry = self.rotated.get(key)
+        if entry is None:
+            surface = pygame.Surface(key[:2], pygame.SRCALPHA)
+            surface.fill(color)
+            degrees = step * 360 / self.angle_steps
+            surface = pygame.transform.rotate(surface, -degrees + 90)
+            entry = (surface, surface.get_width() // 2, surface.get_height() // 2)
+            self.rotated[key] = entry
+        return entry
+
+    def draw(self, screen, bullets, color):
+        """Fill axis-aligned bullet rects (x, y, width, height)"""
+        fill = screen.fill
+        for bullet in bullets:
+            fill(color, (bullet['x'], bullet['y'], bullet['width'], bullet['height']))
+
+    def draw_rotated(self, screen, bullets, color):
+        """Blit bullets turned to face their velocity (dx, dy), centred on the bullet"""
+        if not bullets:
+            return
+        scale = self.angle_steps / (2 * math.pi)
+        steps = self.angle_steps
+        rotated = self.rotated
+        batch = []
+        for bullet in bullets:
+            width, height = bullet['width'], bullet['height']
+            step = round(math.atan2(bullet['dy'], bullet['dx']) * scale) % steps
+            entry = rotated.get((int(width), int(height), color, step)) \
+                or self.rotated_sprite(width, height, color, step)
+            surface, half_width, half_height = entry
+            batch.append((surface, (_round(bullet['x'] + width // 2) - half_width,
+                                    _round(bullet['y'] + height // 2) - half_height)))
+        screen.blits(batch, doreturn=False)
+
+
+# Shared by the player and every enemy
+bullet_sprites = BulletSprites()
@@ -0,0 +1,96 @@
+"""
+Dirty-rectangle presentation for the game loop. Instead of clearing the
+whole screen and flipping it every frame, only the areas drawn in the
+previous frame are cleared and only those plus this frame's areas are
+pushed with pygame.display.update(rects). The screen surface is still
+drawn as usual; what shrinks is the clear and the copy to the display,
+which dominate on software-rendered displays.
+"""
+
+import math
+import pygame
+from constants import *
+
+# Fall back to a full flip when a frame touches more rects than this
+MAX_RECTS = 256
+
+
+def player_rects(player):
+    """Everything Player.draw() can touch"""
+    center_x = player.x + player.width / 2
+    center_y = player.y + player.height / 2
+    # Body, health bar and the direction indicator (30px line, 3px wide)
+    reach = player.direction_indicator_length + 2
+    rects = [pygame.Rect(int(center_x - reach), int(player.y - 15),
+                         reach * 2 + 1, int(center_y - player.y + 15) + reach + 1)]
+    for bullet in player.bullets:
+        # A 5x10 bullet rotated any way fits in its 12px diagonal
+        bullet_x = bullet['x'] + bullet['width'] // 2
+        bullet_y = bullet['y'] + bullet['height'] // 2
+        half = int(math.hypot(bullet['width'], bullet['height']) / 2) + 2
+        rects.append(pygame.Rect(int(bullet_x) - half, int(bullet_y) - half, half * 2, half * 2))
+    if player.special_weapon_active:
+        radius = player.special_weapon_radius
+        rects.append(pygame.Rect(int(center_x) - radius - 1, int(center_y) - radius - 1, radius * 2 + 2, radius * 2 + 2))
+    if player.has_special_weapon:
+        rects.append(pygame.Rect(15, SCREEN_HEIGHT - 45, 40, 30))
+    return rects
+
+
+def enemy_rects(enemy):
+    """Everything Enemy.draw() can touch"""
+    rects = [pygame.Rect(int(enemy.x), int(enemy.y) - 10, enemy.width + 1, enemy.height + 11)]
+    for bullet in enemy.bullets:
+        rects.append(pygame.Rect(int(bullet['x']), int(bullet['y']), int(bullet['width']) + 1, int(bullet['height']) + 1))
+    return rects
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen, background=BLACK, max_rects=MAX_RECTS):
+        self.screen = screen
+        self.background = background
+        self.max_rects = max_rects
+        self.bounds = screen.get_rect()
+        self.previous = []
+        self.current = []
+        self.full = True
+        self.full_frames = 0
+
+    def invalidate(self):
+        """Repaint and present the whole screen next frame (e.g. after a menu or summary screen)"""
+        self.full = True
+
+    def begin_frame(self):
+        if self.full:
+            self.screen.fill(self.background)
+        else:
+            fill = self.screen.fill
+            background = self.background
+            for rect in self.previous:
+                fill(background, rect)
+        self.current = []
+
+    def add(self, rect):
+        if rect is not None:
+            self.current.append(rect)
+
+    def extend(self, rects):
+        self.current.extend(rect for rect in rects if rect is not None)
+
+    def add_player(self, player):
+        self.current.extend(player_rects(player))
+
+    def add_enemy(self, enemy):
+        self.current.extend(enemy_rects(enemy))
+
+    def end_frame(self):
+        bounds = self.bounds
+        current = [rect.clip(bounds) for rect in map(pygame.Rect, self.current)]
+        current = [rect for rect in current if rect.width and rect.height]
+        if self.full or len(self.previous) + len(current) > self.max_rects:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(self.previous + current)
+        self.previous = current
+        self.full = False
@@ -0,0 +1,80 @@
+"""
+Pre-rendered Ring of Fire animation. Each of the effect's frames (random
+particles plus the outline, faded for that frame) is drawn once per
+radius, on first use, and stored as the small tiles it actually covers.
+Playing the effect is then one blits call of those tiles per frame, with
+no surface allocation, circle drawing or alpha blending of the empty
+middle of the ring.
+"""
+
+import math
+import random
+import pygame
+
+PARTICLE_COUNT = 20
+RING_COLOR = (255, 100, 0)
+RING_WIDTH = 3
+TILE = 32  # Frames are kept as the TILE x TILE pieces that are not empty
+
+
+def render_frame(radius, frames_left, duration, rng):
+    """One frame exactly as the old per-frame Player.draw_special_weapon drew it"""
+    alpha = int(255 * (frames_left / duration))
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    for _ in range(PARTICLE_COUNT):
+        angle = rng.uniform(0, math.pi * 2)
+        distance = radius * rng.uniform(0.7, 1.0)
+        particle_x = radius + math.cos(angle) * distance
+        particle_y = radius + math.sin(angle) * distance
+        size = rng.randint(5, 15)
+        color_mix = rng.uniform(0, 1)
+        color = (255, int(255 * (1 - color_mix)), 0, alpha)
+        pygame.draw.circle(surface, color, (particle_x, particle_y), size)
+    pygame.draw.circle(surface, RING_COLOR + (alpha,), (radius, radius), radius, RING_WIDTH)
+    return surface
+
+
+def split_tiles(surface, origin_x, origin_y):
+    """[(tile, x, y)] covering the non-transparent parts of `surface`, positions relative to the origin"""
+    width, height = surface.get_size()
+    tiles = []
+    for y in range(0, height, TILE):
+        for x in range(0, width, TILE):
+            tile = surface.subsurface((x, y, min(TILE, width - x), min(TILE, height - y)))
+            used = tile.get_bounding_rect()
+            if used.width:
+                tiles.append((tile.subsurface(used).copy(), x + used.x - origin_x, y + used.y - origin_y))
+    return tiles
+
+
+class RingOfFire:
+    """The animation for one radius; frame k is shown with k frames of the effect left"""
+
+    def __init__(self, radius, duration=30, seed=None):
+        self.radius = radius
+        self.duration = duration
+        # Own generator, so drawing never consumes the game's random stream
+        self.rng = random.Random(seed)
+        self.frames = {}
+
+    def frame(self, frames_left):
+        tiles = self.frames.get(frames_left)
+        if tiles is None:
+            surface = render_frame(self.radius, frames_left, self.duration, self.rng)
+            tiles = self.frames[frames_left] = split_tiles(surface, self.radius, self.radius)
+        return tiles
+
+    def draw(self, screen, center_x, center_y, frames_left):
+        screen.blits([(tile, (center_x + x, center_y + y)) for tile, x, y in self.frame(frames_left)],
+                     doreturn=False)
+
+
+_effects = {}
+
+
+def ring_of_fire(radius):
+    """Shared animation for a weapon radius, built on first use"""
+    effect = _effects.get(radius)
+    if effect is None:
+        effect = _effects[radius] = RingOfFire(radius)
+    return effect
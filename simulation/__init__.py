@@ -0,0 +1,20 @@
+# simulation/__init__.py
+
+from .engine import Simulation
+from .controller import AutoPilotController, KeyState
+from .parallel import ParallelEvaluator
+from .fitness_cache import FitnessCache
+from .rng import RngStreams
+from .checkpoint import Checkpointer, save_checkpoint, load_checkpoint
+
+__all__ = [
+    "Simulation",
+    "AutoPilotController",
+    "KeyState",
+    "ParallelEvaluator",
+    "FitnessCache",
+    "RngStreams",
+    "Checkpointer",
+    "save_checkpoint",
+    "load_checkpoint",
+]
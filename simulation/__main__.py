@@ -0,0 +1,88 @@
+"""
+Offline training entry point: python -m simulation --generations 500
+"""
+
+import argparse
+import time
+from simulation import Simulation, ParallelEvaluator, FitnessCache, Checkpointer, load_checkpoint
+from visibility import GenerationLogger
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolve enemies headlessly, without rendering")
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--population-size", type=int, default=10)
+    parser.add_argument("--mutation-rate", type=float, default=0.1)
+    parser.add_argument("--max-frames", type=int, default=3600, help="Frame limit per episode")
+    parser.add_argument("--workers", type=int, default=0, help="Evaluate in N worker processes (0 = in-process)")
+    parser.add_argument("--batch-size", type=int, default=10, help="Enemies per episode (one on-screen wave)")
+    parser.add_argument("--world", action="store_true", help="Use the vectorized WorldState bullet updates")
+    parser.add_argument("--batch-move", action="store_true", help="Move the population with the batched kernel")
+    parser.add_argument("--batch-evolve", action="store_true", help="Evolve the population as one gene matrix")
+    parser.add_argument("--fitness-cache", type=int, default=0, help="Cache up to N genomes' episode stats")
+    parser.add_argument("--fitness-cache-path", help="Shelve file backing the fitness cache")
+    parser.add_argument("--seed", type=int, help="Seed every stream for a reproducible run")
+    parser.add_argument("--log-dir", help="Stream every scored generation to a binary log in this directory")
+    parser.add_argument("--checkpoint", help="Save the evolutionary state to this file while training")
+    parser.add_argument("--checkpoint-every", type=int, default=10, help="Generations between checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from --checkpoint; --generations is the total to reach")
+    args = parser.parse_args()
+
+    evaluator = None
+    if args.workers:
+        evaluator = ParallelEvaluator(args.workers, args.batch_size, args.max_frames,
+                                      use_world=args.world, batch_movement=args.batch_move)
+
+    cache = None
+    if args.fitness_cache or args.fitness_cache_path:
+        cache = FitnessCache(args.fitness_cache or 10000, args.fitness_cache_path)
+
+    logger = GenerationLogger(args.log_dir) if args.log_dir else None
+
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint")
+    checkpointer = Checkpointer(args.checkpoint, args.checkpoint_every) if args.checkpoint else None
+
+    sim = Simulation(args.population_size, args.mutation_rate, max_frames=args.max_frames, evaluator=evaluator,
+                     use_world=args.world, batch_movement=args.batch_move,
+                     batch_evolution=args.batch_evolve, fitness_cache=cache,
+                     seed=args.seed, checkpointer=checkpointer, batch_size=args.batch_size)
+
+    enemies = None
+    generations = args.generations
+    if args.resume:
+        enemies = sim.restore(load_checkpoint(args.checkpoint))
+        generations = max(0, args.generations - sim.generation + 1)
+        print(f"Resuming at generation {sim.generation} ({sim.elapsed:.0f}s already trained)")
+    start = time.perf_counter() - sim.elapsed
+
+    def report(generation, enemies):
+        best = max(e.chromosome[59] for e in enemies)
+        elapsed = time.perf_counter() - start
+        frames = sim.frames_simulated + (evaluator.frames_simulated if evaluator else 0)
+        fps = frames / max(elapsed, 1e-9)
+        line = f"Gen {generation}: best fitness {best:.1f} | {fps:.0f} frames/s"
+        if cache:
+            line += f" | cache hits {cache.hit_rate:.0%}"
+        print(line)
+        if logger:
+            logger.log(enemies, generation)
+
+    try:
+        enemies = sim.run(generations, enemies, on_generation=report)
+        if checkpointer:
+            checkpointer.submit(sim.capture(enemies))
+    finally:
+        if checkpointer:
+            checkpointer.close()
+        if evaluator:
+            evaluator.close()
+        if cache:
+            cache.close()
+        if logger:
+            logger.close()
+
+
+if __name__ == "__main__":
+    main()
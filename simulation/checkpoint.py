@@ -0,0 +1,122 @@
+"""
+Checkpoints of a headless training run: everything needed to continue
+evolving from where a run stopped without re-simulating any generation.
+
+A checkpoint is a single .npz file holding the gene matrix of the next
+(not yet evaluated) population, the fitness of the last scored one and a
+JSON header with the generation counter, GA parameters, RNG states,
+elapsed stats and, if the run has one, the fitness cache contents. Files
+are written to a temporary name and renamed into place, so a crash
+mid-write leaves the previous checkpoint intact.
+
+A resumed run continues exactly like an uninterrupted one when it is
+seeded, or when it is unseeded but evaluated in-process without batch
+movement. Unseeded BatchMover episodes and unseeded worker processes draw
+from generators a checkpoint does not capture.
+"""
+
+import io
+import json
+import os
+import queue
+import random
+import threading
+import numpy as np
+import genetic_algorithm
+
+CHECKPOINT_VERSION = 1
+
+
+def rng_states():
+    """
+    States of the process-wide generators an unseeded run draws from in
+    this process. BatchMover's per-episode generators and those of worker
+    processes are not included.
+    """
+    version, internal, gauss_next = random.getstate()
+    return {
+        "random": [version, list(internal), gauss_next],
+        "genetic_algorithm": genetic_algorithm.default_rng.bit_generator.state,
+    }
+
+
+def restore_rng_states(states):
+    version, internal, gauss_next = states["random"]
+    random.setstate((version, tuple(internal), gauss_next))
+    genetic_algorithm.default_rng.bit_generator.state = states["genetic_algorithm"]
+
+
+def save_checkpoint(path, state):
+    """Atomically write a checkpoint dict as produced by Simulation.capture()"""
+    header = {key: value for key, value in state.items() if key not in ("genes", "fitness")}
+    header["version"] = CHECKPOINT_VERSION
+
+    buffer = io.BytesIO()
+    np.savez(buffer, genes=state["genes"], fitness=state["fitness"],
+             header=np.frombuffer(json.dumps(header).encode(), dtype=np.uint8))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buffer.getbuffer())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        state = json.loads(data["header"].tobytes())
+        if state["version"] != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {state['version']}")
+        state["genes"] = data["genes"]
+        state["fitness"] = data["fitness"]
+    return state
+
+
+class Checkpointer:
+    """
+    Writes checkpoints on a background thread. submit() only queues an
+    already-copied state; if the writer falls behind, older pending
+    checkpoints are skipped in favour of the newest.
+    """
+
+    def __init__(self, path, every=1):
+        self.path = path
+        self.every = every
+        self.saved = 0
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="checkpointer", daemon=True)
+        self.thread.start()
+
+    def due(self, generation):
+        return generation % self.every == 0
+
+    def submit(self, state):
+        self.queue.put(state)
+
+    def close(self):
+        """Write whatever is still queued and stop the writer thread"""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def _run(self):
+        running = True
+        while running:
+            latest = self.queue.get()
+            # Skip to the newest checkpoint queued so far
+            while True:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                else:
+                    latest = item
+            if latest is None:
+                break
+            save_checkpoint(self.path, latest)
+            self.saved += 1
@@ -0,0 +1,71 @@
+"""
+Scripted player controllers for headless simulation
+"""
+
+import math
+import pygame
+
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed() so Player.move/shoot work without a display"""
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class AutoPilotController:
+    """
+    Simple AI player: dodges the nearest incoming enemy bullet, otherwise
+    lines up underneath the closest enemy and keeps the trigger held.
+    """
+
+    def __init__(self, danger_radius=80, special_weapon_threshold=3):
+        self.danger_radius = danger_radius
+        self.special_weapon_threshold = special_weapon_threshold
+
+    def get_keys(self, player, enemies):
+        pressed = {pygame.K_SPACE}
+        center_x = player.x + player.width / 2
+        center_y = player.y + player.height / 2
+
+        # Dodge: step sideways away from the closest bullet heading our way
+        world = getattr(player, "world", None)
+        if world is not None:
+            threat = world.nearest_threat(center_x, center_y, self.danger_radius)
+        else:
+            threat = None
+            threat_dist = self.danger_radius
+            for enemy in enemies:
+                for bullet in enemy.bullets:
+                    if bullet['dy'] <= 0:
+                        continue
+                    dist = math.hypot(bullet['x'] - center_x, bullet['y'] - center_y)
+                    if dist < threat_dist:
+                        threat_dist = dist
+                        threat = bullet
+
+        if threat is not None:
+            pressed.add(pygame.K_LEFT if threat['x'] >= center_x else pygame.K_RIGHT)
+        else:
+            alive = [e for e in enemies if e.alive]
+            if alive:
+                target = min(alive, key=lambda e: abs(e.x + e.width / 2 - center_x))
+                target_x = target.x + target.width / 2
+                if target_x < center_x - player.speed:
+                    pressed.add(pygame.K_LEFT)
+                elif target_x > center_x + player.speed:
+                    pressed.add(pygame.K_RIGHT)
+
+        # Ring of Fire once enough enemies are packed around the player
+        if player.has_special_weapon:
+            in_range = sum(
+                1 for e in enemies if e.alive and
+                math.hypot(e.x + e.width / 2 - center_x, e.y + e.height / 2 - center_y) <= player.special_weapon_radius
+            )
+            if in_range >= self.special_weapon_threshold:
+                pressed.add(pygame.K_f)
+
+        return KeyState(pressed)
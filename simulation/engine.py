@@ -0,0 +1,213 @@
+"""
+Headless, render-free game loop for evolving enemy populations offline
+"""
+
+import time
+import numpy as np
+import pygame
+from constants import FPS
+from player import Player
+from bullet_pool import bullet_pool
+from enemy import Enemy
+from enemy.chromosome import Chromosome, population_matrix
+from genetic_algorithm import evolve_population, evolve_population_batch
+from simulation.controller import AutoPilotController
+from simulation.rng import RngStreams
+from simulation.checkpoint import rng_states, restore_rng_states
+from world import WorldState, FrameIndex
+from enemy.enemy_movement import BatchMover
+from enemy.firing import FiringScheduler
+
+
+class Simulation:
+    """
+    Runs the same per-frame update as main.main() without a display surface,
+    drawing or a frame cap, so generations advance as fast as the CPU allows.
+    """
+
+    def __init__(self, population_size=10, mutation_rate=0.1, controller=None, max_frames=60 * FPS, evaluator=None,
+                 use_world=False, batch_movement=False, batch_evolution=False, fitness_cache=None,
+                 seed=None, checkpointer=None, batch_size=10):
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.controller = controller or AutoPilotController()
+        self.max_frames = max_frames
+        self.evaluator = evaluator  # e.g. ParallelEvaluator; None plays every wave in-process
+        self.batch_size = batch_size  # Enemies per in-process wave, as ParallelEvaluator splits them
+        self.use_world = use_world  # Vectorized WorldState bullet updates instead of per-object loops
+        self.world = None
+        self.batch_movement = batch_movement  # Move the whole population with BatchMover
+        self.mover = None
+        self.scheduler = None  # Fires the episode's enemies, built by run_episode
+        self.evolve = evolve_population_batch if batch_evolution else evolve_population
+        self.fitness_cache = fitness_cache  # Optional FitnessCache
+        self.scenario_seed = seed
+        self.streams = RngStreams(seed) if seed is not None else None
+        self.episode_rng = None
+        self.checkpointer = checkpointer  # Optional Checkpointer, saved after every `every` generations
+        self.generation = 1
+        self.frames_simulated = 0
+        self.elapsed = 0.0  # Seconds spent in run(), carried across resumes
+        self.last_scored = []  # Most recently evaluated population
+
+    def new_population(self):
+        if self.streams is None:
+            return [Enemy(None) for _ in range(self.population_size)]
+        return [Enemy(None, rng=self.streams.initial_enemy(slot)) for slot in range(self.population_size)]
+
+    def seed_episode(self, enemies, generation, first_slot=0, batch=0):
+        """Give every enemy its own stream for this generation and re-draw its spawn point"""
+        if self.streams is None:
+            return
+        for slot, enemy in enumerate(enemies, first_slot):
+            enemy.rng = self.streams.enemy(generation, slot)
+            enemy.respawn()
+        self.episode_rng = self.streams.episode(generation, batch)
+
+    def step(self, player, enemies):
+        """Advance one frame. Returns the list of enemies still alive."""
+        keys = self.controller.get_keys(player, enemies)
+
+        player.move(keys)
+        player.shoot(keys)
+        index = FrameIndex([enemy for enemy in enemies if enemy.alive])
+        if self.world:
+            self.world.update_player_bullets()
+        else:
+            player.update_bullets(enemies)
+
+        if (keys[pygame.K_f] or keys[pygame.K_q]) and player.has_special_weapon:
+            player.use_special_weapon(enemies)
+        player.update_special_weapon()
+
+        alive_enemies = [enemy for enemy in enemies if enemy.alive]
+        index.index_player_bullets(player.bullets)
+        if self.mover:
+            for enemy in alive_enemies:
+                enemy.time_alive += 1
+            self.mover.move(player, index)
+        else:
+            for enemy in alive_enemies:
+                enemy.time_alive += 1
+                enemy.move(player, alive_enemies, index)
+
+        self.scheduler.fire(player)
+        if not self.world:
+            for enemy in alive_enemies:
+                enemy.update_bullets(player)
+        else:
+            self.world.update_enemy_bullets(player)
+
+        self.frames_simulated += 1
+        return alive_enemies
+
+    def run_episode(self, enemies):
+        """
+        Play one episode against a fresh player until every enemy is dead,
+        the player dies or max_frames is reached, then score the population.
+        """
+        player = Player(None)
+        if self.use_world:
+            self.world = WorldState()
+            self.world.add_enemies(enemies)
+            self.world.add_player(player)
+        if self.batch_movement:
+            self.mover = BatchMover(enemies, self.episode_rng)
+        self.scheduler = FiringScheduler(enemies)
+
+        for _ in range(self.max_frames):
+            alive_enemies = self.step(player, enemies)
+            if not alive_enemies or not player.alive:
+                break
+
+        for enemy in enemies:
+            enemy.calculate_fitness()
+        bullet_pool.reclaim(enemies)
+        bullet_pool.reclaim([player])
+        return player
+
+    def evaluate(self, enemies):
+        """Score a population, skipping genomes the fitness cache has already seen"""
+        pending = enemies
+        if self.fitness_cache:
+            pending = self.fitness_cache.apply(enemies, self.scenario_seed)
+            if not pending:
+                return
+
+        if self.evaluator:
+            self.evaluator.evaluate(pending, self.scenario_seed, self.generation)
+        else:
+            # Same waves and per-wave seeding as the workers, so a seeded run
+            # does not depend on where it is evaluated
+            for batch, first in enumerate(range(0, len(pending), self.batch_size)):
+                wave = pending[first:first + self.batch_size]
+                self.seed_episode(wave, self.generation, first, batch)
+                self.run_episode(wave)
+
+        if self.fitness_cache:
+            self.fitness_cache.record(pending, self.scenario_seed)
+
+    def run(self, generations, enemies=None, on_generation=None):
+        """
+        Evolve for the given number of generations and return the next,
+        not yet evaluated, population. on_generation(generation, enemies)
+        is called after each generation has been scored.
+        """
+        if enemies is None:
+            enemies = self.new_population()
+
+        for _ in range(generations):
+            start = time.perf_counter()
+            self.evaluate(enemies)
+            if on_generation:
+                on_generation(self.generation, enemies)
+            rng = self.streams.ga_step(self.generation) if self.streams else None
+            self.last_scored = enemies
+            enemies = self.evolve(enemies, self.population_size, self.mutation_rate, rng)
+            self.elapsed += time.perf_counter() - start
+            self.generation += 1
+            if self.checkpointer and self.checkpointer.due(self.generation - 1):
+                self.checkpointer.submit(self.capture(enemies))
+
+        return enemies
+
+    def capture(self, enemies):
+        """
+        Snapshot of the run with `enemies` as the next population to evaluate,
+        for simulation.checkpoint.save_checkpoint()
+        """
+        frames = self.frames_simulated + (self.evaluator.frames_simulated if self.evaluator else 0)
+        return {
+            "genes": population_matrix([enemy.chromosome for enemy in enemies]),
+            "fitness": np.array([enemy.chromosome[59] for enemy in self.last_scored]),
+            "generation": self.generation,
+            "population_size": self.population_size,
+            "mutation_rate": self.mutation_rate,
+            "seed": self.scenario_seed,
+            "frames_simulated": frames,
+            "elapsed": self.elapsed,
+            "rng_states": rng_states(),
+            # Cached stats decide which genomes play again, so a run resumes
+            # exactly only with the cache it had
+            "fitness_cache": self.fitness_cache.state() if self.fitness_cache else None,
+        }
+
+    def restore(self, state):
+        """Continue from a loaded checkpoint. Returns the population to evaluate next."""
+        if state["seed"] != self.scenario_seed:
+            raise ValueError(f"Checkpoint was made with seed {state['seed']}, not {self.scenario_seed}")
+        cache_state = state.get("fitness_cache")
+        if (cache_state is None) != (self.fitness_cache is None):
+            raise ValueError("Checkpoint was made " + ("without" if cache_state is None else "with") +
+                             " a fitness cache; resume with the same cache setting")
+        self.generation = state["generation"]
+        self.population_size = state["population_size"]
+        self.mutation_rate = state["mutation_rate"]
+        self.frames_simulated = state["frames_simulated"]
+        self.elapsed = state["elapsed"]
+        if self.fitness_cache:
+            self.fitness_cache.restore(cache_state)
+        enemies = [Enemy(None, chromosome) for chromosome in Chromosome.from_matrix(np.array(state["genes"]))]
+        # Building the enemies drew spawn points; put the generators back afterwards
+        restore_rng_states(state["rng_states"])
+        return enemies
@@ -0,0 +1,103 @@
+"""
+Fitness memoization for headless training: skips re-simulating elites and
+duplicate genomes that crossover keeps reproducing
+"""
+
+import hashlib
+import shelve
+from collections import OrderedDict
+import numpy as np
+from simulation.parallel import STAT_FIELDS
+
+
+class FitnessCache:
+    """
+    LRU cache of episode stats keyed by a stable hash of the quantized
+    chromosome (genes 0-58, fitness excluded) plus the scenario seed, with an
+    optional shelve file as a backing store shared between runs.
+
+    Stats rather than fitness are cached so calculate_fitness can re-score a
+    cached enemy exactly as if it had just played. In shared-wave episodes
+    an enemy's stats also depend on its wave-mates, so a hit reuses the
+    result of the first wave that genome played in.
+    """
+
+    def __init__(self, capacity=10000, path=None, decimals=6):
+        self.capacity = capacity
+        self.decimals = decimals
+        self.entries = OrderedDict()
+        self.store = shelve.open(path) if path else None
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, chromosome, seed=None):
+        genes = np.round(chromosome.to_array()[:59], self.decimals) + 0.0  # + 0.0 folds -0.0 into 0.0
+        digest = hashlib.blake2b(genes.tobytes(), digest_size=16)
+        digest.update(repr(seed).encode())
+        return digest.hexdigest()
+
+    def get(self, chromosome, seed=None):
+        key = self.key(chromosome, seed)
+        stats = self.entries.get(key)
+        if stats is not None:
+            self.entries.move_to_end(key)
+        elif self.store is not None and key in self.store:
+            stats = self.store[key]
+            self._remember(key, stats)
+
+        if stats is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return stats
+
+    def put(self, chromosome, stats, seed=None):
+        key = self.key(chromosome, seed)
+        self._remember(key, stats)
+        if self.store is not None:
+            self.store[key] = stats
+
+    def _remember(self, key, stats):
+        self.entries[key] = stats
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def apply(self, enemies, seed=None):
+        """Score enemies found in the cache; return the ones that still need an episode"""
+        pending = []
+        for enemy in enemies:
+            stats = self.get(enemy.chromosome, seed)
+            if stats is None:
+                pending.append(enemy)
+                continue
+            for field, value in stats.items():
+                setattr(enemy, field, value)
+            enemy.calculate_fitness()
+        return pending
+
+    def record(self, enemies, seed=None):
+        for enemy in enemies:
+            self.put(enemy.chromosome, {field: getattr(enemy, field) for field in STAT_FIELDS}, seed)
+
+    def state(self):
+        """In-memory entries (least recently used first) and counters, as JSON-able data for checkpoints"""
+        return {"entries": list(self.entries.items()), "hits": self.hits, "misses": self.misses}
+
+    def restore(self, state):
+        """Replace the in-memory entries and counters with a state() snapshot"""
+        self.entries.clear()
+        for key, stats in state["entries"]:
+            self._remember(key, stats)
+        self.hits = state["hits"]
+        self.misses = state["misses"]
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
@@ -0,0 +1,75 @@
+"""
+Process-pool fitness evaluation: each batch of chromosomes plays its own
+headless episode in a worker process
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+STAT_FIELDS = ("time_alive", "damage_dealt", "hits_scored", "shots_fired", "distance_moved", "alive")
+
+
+def evaluate_batch(chromosomes, max_frames, seed=None, generation=0, first_slot=0, batch=0,
+                   use_world=False, batch_movement=False):
+    """Worker entry point: play one episode with these chromosomes and return (per-enemy stats, frames)"""
+    from enemy import Enemy
+    from simulation.engine import Simulation
+
+    sim = Simulation(len(chromosomes), max_frames=max_frames, seed=seed,
+                     use_world=use_world, batch_movement=batch_movement)
+    enemies = [Enemy(None, chromosome) for chromosome in chromosomes]
+    sim.seed_episode(enemies, generation, first_slot, batch)
+    sim.run_episode(enemies)
+    stats = [{field: getattr(enemy, field) for field in STAT_FIELDS} for enemy in enemies]
+    return stats, sim.frames_simulated
+
+
+class ParallelEvaluator:
+    """
+    Splits a population into batches of batch_size enemies (one on-screen
+    wave each), evaluates the batches on a ProcessPoolExecutor, then copies
+    the episode stats back onto the original enemies and scores them, which
+    writes fitness into gene 59. use_world and batch_movement select the
+    same episode modes as the Simulation options of that name.
+    """
+
+    def __init__(self, workers=None, batch_size=10, max_frames=3600, use_world=False, batch_movement=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_frames = max_frames
+        self.use_world = use_world
+        self.batch_movement = batch_movement
+        self.executor = None
+        self.frames_simulated = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def evaluate(self, enemies, seed=None, generation=0):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        batches = [enemies[i:i + self.batch_size] for i in range(0, len(enemies), self.batch_size)]
+        futures = [
+            self.executor.submit(evaluate_batch, [e.chromosome for e in batch], self.max_frames,
+                                 seed, generation, b * self.batch_size, b, self.use_world, self.batch_movement)
+            for b, batch in enumerate(batches)
+        ]
+
+        for batch, future in zip(batches, futures):
+            batch_stats, frames = future.result()
+            self.frames_simulated += frames
+            for enemy, stats in zip(batch, batch_stats):
+                for field, value in stats.items():
+                    setattr(enemy, field, value)
+                enemy.calculate_fitness()
+
+        return enemies
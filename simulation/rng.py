@@ -0,0 +1,47 @@
+"""
+Deterministic random streams for headless runs. Every stream is derived
+from the root seed and a fixed key (what it is for, generation, slot), not
+from the order streams are requested in, so results do not depend on how
+work is split across processes.
+"""
+
+import random
+import numpy as np
+
+# Stream kinds, first element of every spawn key
+INITIAL_POPULATION = 0
+ENEMY = 1
+EPISODE = 2
+GA_STEP = 3
+
+
+class RngStreams:
+    def __init__(self, seed):
+        self.seed = seed
+
+    def _sequence(self, *key):
+        return np.random.SeedSequence(self.seed, spawn_key=key)
+
+    def numpy_stream(self, *key):
+        return np.random.Generator(np.random.PCG64(self._sequence(*key)))
+
+    def python_stream(self, *key):
+        """random.Random stream: same API as the `random` module, for the per-object code"""
+        state = self._sequence(*key).generate_state(4, np.uint32)
+        return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+    def initial_enemy(self, slot):
+        """Genes and spawn point of an enemy in the first generation"""
+        return self.python_stream(INITIAL_POPULATION, slot)
+
+    def enemy(self, generation, slot):
+        """Spawn point, movement and shooting of the enemy in `slot` during `generation`"""
+        return self.python_stream(ENEMY, generation, slot)
+
+    def episode(self, generation, batch):
+        """Population-wide draws of one episode (batched movement kernel)"""
+        return self.numpy_stream(EPISODE, generation, batch)
+
+    def ga_step(self, generation):
+        """Selection, crossover and mutation producing the generation after `generation`"""
+        return self.numpy_stream(GA_STEP, generation)
@@ -0,0 +1,127 @@
+"""
+Seeded equivalence of the batched movement kernel with the per-object path.
+
+Given the same uniform draws, batch_behavior_vectors and BatchMover must
+reproduce Enemy.get_movement_influence / Enemy.move exactly. The only
+differences allowed between the two paths are:
+
+- Random streams: the batch kernel draws a fixed (N, 20) + N + N block per
+  frame from a NumPy generator, while the per-object path draws from
+  `random` once per active behavior, once for DODGE's idle jitter and once
+  for the move's variance. Equal seeds therefore give different runs; the
+  tests below hand both paths the same draws.
+- Simultaneous update: BatchMover blends group behavior against the
+  positions at the start of the frame, the per-object loop against
+  positions already updated this frame. The tests switch GROUP off so the
+  comparison does not depend on update order.
+"""
+
+import random
+import numpy as np
+import pytest
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from behavior_gene import BehaviorGene
+from enemy import Enemy
+from enemy.chromosome import Chromosome
+from enemy.gene_index import GeneIndex
+from enemy.enemy_movement import BEHAVIOR_COUNT, BatchMover, batch_behavior_vectors, gene_matrix
+from player import Player
+
+POPULATION = 60
+DODGE = BehaviorGene.DODGE.value
+JITTER = (-0.3, 0.3)  # DODGE's idle jitter, rng.uniform(-0.3, 0.3)
+
+
+class ReplayRng:
+    """
+    Stands in for enemy.rng and answers with given uniform draws: `variance`
+    in call order for variance factors, `jitter` for DODGE's idle jitter
+    """
+
+    def __init__(self, variance, jitter):
+        self.variance = iter(variance)
+        self.jitter = jitter
+
+    def uniform(self, a, b):
+        u = self.jitter if (a, b) == JITTER else next(self.variance)
+        return a + (b - a) * u
+
+
+def make_population(seed):
+    """Enemies with random behavior subsets, spread over the screen and their phase tables"""
+    rng = random.Random(seed)
+    enemies = []
+    for _ in range(POPULATION):
+        chromosome = Chromosome(Enemy(None, rng=rng).chromosome)
+        for behavior in range(BEHAVIOR_COUNT):
+            # Only genes set to exactly 1 are active
+            chromosome[behavior] = 1 if rng.random() < 0.3 else rng.random() * 0.99
+        chromosome[GeneIndex.GROUP] = 0.0
+        enemy = Enemy(None, chromosome, rng=rng)
+        enemy.x = rng.uniform(0, SCREEN_WIDTH - enemy.width)
+        enemy.y = rng.uniform(0, SCREEN_HEIGHT - enemy.height)
+        enemy.time_alive = rng.randint(0, 20000)  # Past the tables too
+        enemies.append(enemy)
+    return enemies
+
+
+def make_player(enemies, seed):
+    """A player with bullets close to some enemies, so DODGE takes both branches"""
+    rng = random.Random(seed)
+    player = Player(None)
+    for enemy in enemies[::6]:
+        player.bullets.append({'x': enemy.x + rng.uniform(-100, 100), 'y': enemy.y + rng.uniform(-100, 100)})
+    return player
+
+
+def active(enemy):
+    return [b for b in range(BEHAVIOR_COUNT) if enemy.chromosome[b] == 1]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_behavior_vectors_match_movement_influence(seed):
+    enemies = make_population(seed)
+    player = make_player(enemies, seed)
+    draws = np.random.default_rng(seed)
+    u_behavior = draws.random((POPULATION, BEHAVIOR_COUNT))
+    u_dodge = draws.random(POPULATION)
+
+    batch_x, batch_y = batch_behavior_vectors(
+        gene_matrix(enemies),
+        np.array([(e.x, e.y) for e in enemies]),
+        np.array([e.time_alive for e in enemies], dtype=float),
+        (player.x, player.y),
+        np.array([(b['x'], b['y']) for b in player.bullets]),
+        u_behavior, u_dodge)
+
+    for i, enemy in enumerate(enemies):
+        behaviors = active(enemy)
+        move_x, move_y = 0, 0
+        for behavior in behaviors:
+            enemy.rng = ReplayRng([u_behavior[i, behavior]], u_dodge[i])
+            influence_x, influence_y = enemy.get_movement_influence(behavior, player)
+            move_x += influence_x * (1.0 / len(behaviors))
+            move_y += influence_y * (1.0 / len(behaviors))
+        assert (batch_x[i], batch_y[i]) == (move_x, move_y), f"enemy {i}, behaviors {behaviors}"
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_mover_matches_enemy_move(seed):
+    batch = make_population(seed)
+    sequential = make_population(seed)
+    player = make_player(batch, seed)
+
+    BatchMover(batch, np.random.default_rng(seed)).move(player)
+
+    # Replay the mover's draws: (N, 20) variance factors, N jitters, N move variances
+    draws = np.random.default_rng(seed)
+    u_behavior = draws.random((POPULATION, BEHAVIOR_COUNT))
+    u_dodge = draws.random(POPULATION)
+    u_move = draws.random(POPULATION)
+    for i, enemy in enumerate(sequential):
+        enemy.rng = ReplayRng([u_behavior[i, b] for b in active(enemy)] + [u_move[i]], u_dodge[i])
+        enemy.move(player, sequential)
+
+    for i, (a, b) in enumerate(zip(batch, sequential)):
+        assert (a.x, a.y, a.distance_moved) == (b.x, b.y, b.distance_moved), f"enemy {i}"
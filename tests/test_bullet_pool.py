@@ -0,0 +1,28 @@
+"""
+BulletPool.discard against a plain list comprehension
+"""
+
+import random
+
+import pytest
+
+from bullet_pool import BulletPool
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_discard_random_indices(seed):
+    rng = random.Random(seed)
+    pool = BulletPool(capacity=0)
+    bullets = [pool.acquire(i, 0, 0, 0, 1, 1) for i in range(rng.randint(0, 40))]
+    indices = sorted(rng.sample(range(len(bullets)), rng.randint(0, len(bullets))))
+
+    removed = [bullets[i] for i in indices]
+    dropped = set(indices)
+    survivors = [bullet for i, bullet in enumerate(bullets) if i not in dropped]
+    pool.discard(bullets, indices)
+
+    assert len(bullets) == len(survivors)
+    assert all(kept is expected for kept, expected in zip(bullets, survivors))
+    assert len(pool.free) == len(removed)
+    assert all(freed is bullet for freed, bullet in zip(pool.free, removed))
+    assert pool.in_use == len(survivors)
@@ -0,0 +1,46 @@
+"""
+Resuming from a checkpoint continues a seeded run exactly
+"""
+
+import pytest
+
+from simulation import Simulation, FitnessCache, save_checkpoint, load_checkpoint
+
+
+def simulation(cache):
+    return Simulation(10, max_frames=300, seed=7, fitness_cache=FitnessCache(100) if cache else None)
+
+
+def run(sim, generations, scores, enemies=None):
+    """Run `generations` more generations, appending each one's best fitness to scores"""
+    return sim.run(generations, enemies, on_generation=lambda generation, scored:
+                   scores.append(max(e.chromosome[59] for e in scored)))
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_resume_matches_uninterrupted_run(tmp_path, cache):
+    uninterrupted = simulation(cache)
+    expected = []
+    run(uninterrupted, 4, expected)
+
+    first = simulation(cache)
+    scores = []
+    enemies = run(first, 2, scores)
+    path = str(tmp_path / "run.npz")
+    save_checkpoint(path, first.capture(enemies))
+
+    resumed = simulation(cache)
+    run(resumed, 2, scores, resumed.restore(load_checkpoint(path)))
+    assert scores == expected
+    if cache:
+        assert (resumed.fitness_cache.hits, resumed.fitness_cache.misses) == \
+            (uninterrupted.fitness_cache.hits, uninterrupted.fitness_cache.misses)
+
+
+def test_resume_refuses_a_different_cache_setting(tmp_path):
+    sim = simulation(cache=True)
+    enemies = sim.run(1)
+    path = str(tmp_path / "run.npz")
+    save_checkpoint(path, sim.capture(enemies))
+    with pytest.raises(ValueError):
+        simulation(cache=False).restore(load_checkpoint(path))
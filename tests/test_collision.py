@@ -0,0 +1,37 @@
+"""
+The grid broad phase finds exactly the pairs a full overlap matrix does
+"""
+
+import numpy as np
+import pytest
+
+from world.collision import BRUTE_FORCE_PAIRS, find_hits
+
+
+def random_boxes(rng, count):
+    """Boxes around the origin on an integer grid, so many share edges; a few are far larger than the rest"""
+    pos = rng.integers(-400, 400, (count, 2)).astype(np.float64)
+    size = rng.choice([0.5, 3.0, 8.0, 20.0], (count, 2))
+    big = rng.random(count) < 0.05
+    size[big] = rng.uniform(40, 250, (big.sum(), 2))
+    return pos, size
+
+
+def overlap_matrix(a_pos, a_size, b_pos, b_size):
+    return ((a_pos[:, 0, None] < b_pos[:, 0] + b_size[:, 0]) & (a_pos[:, 0, None] + a_size[:, 0, None] > b_pos[:, 0]) &
+            (a_pos[:, 1, None] < b_pos[:, 1] + b_size[:, 1]) & (a_pos[:, 1, None] + a_size[:, 1, None] > b_pos[:, 1]))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_grid_matches_full_overlap_matrix(seed):
+    rng = np.random.default_rng(seed)
+    a_count, b_count = rng.integers(40, 400, 2)
+    assert a_count * b_count > BRUTE_FORCE_PAIRS
+    a_pos, a_size = random_boxes(rng, a_count)
+    b_pos, b_size = random_boxes(rng, b_count)
+
+    a_idx, b_idx = find_hits(a_pos, a_size, b_pos, b_size)
+    expected_a, expected_b = np.nonzero(overlap_matrix(a_pos, a_size, b_pos, b_size))
+    assert len(expected_a)
+    assert a_idx.tolist() == expected_a.tolist()
+    assert b_idx.tolist() == expected_b.tolist()
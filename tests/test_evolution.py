@@ -0,0 +1,69 @@
+"""
+evolve_gene_matrix draws from the same distributions as evolve_population
+"""
+
+import random
+from math import comb
+
+import numpy as np
+
+from enemy import Enemy
+from enemy.chromosome import Chromosome, GENE_COUNT, population_matrix
+from genetic_algorithm import evolve_gene_matrix, evolve_population
+
+CHILDREN = 3000
+SIGMAS = 5
+
+
+def std_error(values):
+    """Standard error of values.std() from the fourth central moment; mutation makes them far from normal"""
+    centered = values - values.mean()
+    variance = centered.var()
+    if variance == 0:
+        return 0.0
+    return np.sqrt(max(np.mean(centered ** 4) - variance ** 2, 0) / len(values)) / (2 * np.sqrt(variance))
+
+
+def both_ways(enemies, mutation_rate, seed):
+    """Children (without the elite) of one evolve_population and one evolve_gene_matrix call"""
+    size = CHILDREN + 1
+    per_child = evolve_population(enemies, size, mutation_rate, np.random.default_rng(seed))
+    per_child = population_matrix([enemy.chromosome for enemy in per_child])
+    genes = population_matrix([enemy.chromosome for enemy in enemies])
+    batch = evolve_gene_matrix(genes, size, mutation_rate, np.random.default_rng(seed + 1))
+    return per_child[1:], batch[1:]
+
+
+def test_tournament_winner_frequencies():
+    # Enemy i carries the value i + 1 in every gene, so without mutation each
+    # gene of a child names one of its two tournament winners
+    n = 8
+    enemies = []
+    for i in range(n):
+        chromosome = Chromosome(np.full(GENE_COUNT, i + 1.0))
+        chromosome[59] = 10.0 * (i + 1)  # Fitness rank = i
+        enemies.append(Enemy(None, chromosome, rng=random.Random(i)))
+
+    # Enemy i wins when the other three entrants all come from the i below it
+    expected = np.array([comb(i, 3) / comb(n, 4) for i in range(n)])
+    tolerance = SIGMAS * np.sqrt(expected * (1 - expected) / CHILDREN) + 1e-9
+    for children in both_ways(enemies, 0.0, 0):
+        winners = children[:, 40].astype(int) - 1
+        frequency = np.bincount(winners, minlength=n) / CHILDREN
+        assert (np.abs(frequency - expected) <= tolerance).all()
+
+
+def test_mutation_moments_per_gene():
+    # Identical parents: crossover is a no-op and every difference is mutation
+    parent = Enemy(None, rng=random.Random(0)).chromosome
+    parent[47] = 0.95  # Close to its upper bound, so the clamp matters
+    parent[59] = 1.0
+    enemies = [Enemy(None, parent.copy(), rng=random.Random(i)) for i in range(6)]
+
+    per_child, batch = both_ways(enemies, 0.3, 1)
+    for gene in range(59):
+        a, b = per_child[:, gene], batch[:, gene]
+        mean_tolerance = SIGMAS * np.sqrt((a.var() + b.var()) / CHILDREN) + 1e-9
+        std_tolerance = SIGMAS * np.hypot(std_error(a), std_error(b)) + 1e-9
+        assert abs(a.mean() - b.mean()) <= mean_tolerance, gene
+        assert abs(a.std() - b.std()) <= std_tolerance, gene
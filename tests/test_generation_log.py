@@ -0,0 +1,96 @@
+"""
+Round trips through the column-file generation log format
+"""
+
+import numpy as np
+
+from visibility import GenerationHistory
+from visibility.generation_log import (COLUMNS, MISSING, RECORD_WIDTH, append_blocks, to_column,
+                                       truncate_log, write_meta)
+
+
+def sample_records(count, seed=0):
+    """Records whose every column is representable in its storage dtype"""
+    rng = np.random.default_rng(seed)
+    records = (rng.random((count, RECORD_WIDTH)) * 100).astype(np.float32)
+    for column, (_, dtype) in enumerate(COLUMNS):
+        if dtype.kind in "iu":
+            records[:, column] = rng.integers(0, 120, count)
+    records[:, :20] = rng.integers(0, 2, (count, 20))
+    return records
+
+
+def write_log(path, sizes):
+    write_meta(path)
+    blocks = [(generation, sample_records(size, generation)) for generation, size in enumerate(sizes, 1)]
+    append_blocks(path, blocks)
+    return blocks
+
+
+def test_integer_columns_store_nan_as_missing():
+    values = np.array([3.0, np.nan, 7.0], dtype=np.float32)
+    assert to_column(values, np.dtype(np.int16)).tolist() == [3, MISSING, 7]
+    assert np.isnan(to_column(values, np.dtype(np.float32))[1])
+
+
+def test_toggles_only_round_to_one_when_active():
+    values = np.array([1.0, 0.99995, 0.0, 0.5], dtype=np.float32)
+    stored = to_column(values, np.dtype(np.float16))
+    assert (stored == 1).tolist() == [True, False, False, False]
+    assert np.abs(stored - values).max() < 5e-4
+
+
+def test_appends_read_back_in_order(tmp_path):
+    path = str(tmp_path)
+    blocks = write_log(path, [4, 0])
+    history = GenerationHistory(path)
+    more = [(3, sample_records(7, 3))]
+    append_blocks(path, more)
+    history.refresh()
+
+    assert history.generations.tolist() == [1, 2, 3]
+    for generation, block in blocks + more:
+        assert np.array_equal(history.generation(generation), block)
+
+
+def test_columns_are_stored_narrow(tmp_path):
+    path = str(tmp_path)
+    write_log(path, [10])
+    history = GenerationHistory(path)
+    assert history.gene_column(0).dtype == np.float16
+    assert history.gene_column(25).dtype == np.uint8
+    assert history.gene_column(40).dtype == np.float32
+    assert history.stat("hits_scored").dtype == np.int16
+    assert history.stat("time_alive").dtype == np.int32
+
+
+def test_truncate_drops_later_records(tmp_path):
+    path = str(tmp_path)
+    write_meta(path)
+    first = sample_records(5, 1)
+    written = append_blocks(path, [(1, first)])
+    append_blocks(path, [(2, sample_records(3, 2))])
+
+    truncate_log(path, written, 1)
+    append_blocks(path, [(2, sample_records(6, 3))])
+    history = GenerationHistory(path)
+    assert history.index.tolist() == [[1, 0, 5], [2, 5, 6]]
+    assert np.array_equal(history.generation(1), first)
+    assert np.array_equal(history.generation(2), sample_records(6, 3))
+
+
+def test_append_overwrites_records_past_the_index(tmp_path):
+    """Records written by an append that died before its index row are replaced by the next append"""
+    path = str(tmp_path)
+    write_log(path, [4])
+    with open(path + "/index.i64", "rb") as f:
+        index = f.read()
+    append_blocks(path, [(2, sample_records(9, 5))])
+    with open(path + "/index.i64", "wb") as f:
+        f.write(index)
+
+    block = sample_records(2, 6)
+    append_blocks(path, [(2, block)])
+    history = GenerationHistory(path)
+    assert np.array_equal(history.generation(2), block)
+    assert len(history.stat("alive")) == 6
@@ -0,0 +1,62 @@
+"""
+Queries of GenerationHistory against a small hand-written log
+"""
+
+import numpy as np
+
+from visibility import GenerationHistory
+from visibility.generation_log import RECORD_WIDTH, append_blocks, write_meta
+
+GENE = 40
+
+
+def write_log(path, sizes):
+    """Log one generation per entry of `sizes` with that many random records"""
+    rng = np.random.default_rng(0)
+    write_meta(path)
+    blocks = [(generation, rng.random((size, RECORD_WIDTH)).astype(np.float32))
+              for generation, size in enumerate(sizes, 1)]
+    append_blocks(path, blocks)
+    return blocks
+
+
+def test_gene_stats(tmp_path):
+    blocks = write_log(str(tmp_path), [5, 3, 8])
+    generations, mean, std = GenerationHistory(str(tmp_path)).gene_stats(GENE)
+
+    assert generations.tolist() == [1, 2, 3]
+    for i, (_, block) in enumerate(blocks):
+        column = block[:, GENE].astype(np.float64)
+        assert np.isclose(mean[i], column.mean())
+        assert np.isclose(std[i], column.std())
+
+
+def test_gene_stats_with_empty_generations(tmp_path):
+    blocks = write_log(str(tmp_path), [0, 4, 0, 0, 6, 0])
+    generations, mean, std = GenerationHistory(str(tmp_path)).gene_stats(GENE)
+
+    assert generations.tolist() == [1, 2, 3, 4, 5, 6]
+    empty = [0, 2, 3, 5]
+    assert np.isnan(mean[empty]).all() and np.isnan(std[empty]).all()
+    for i in (1, 4):
+        column = blocks[i][1][:, GENE].astype(np.float64)
+        assert np.isclose(mean[i], column.mean())
+        assert np.isclose(std[i], column.std())
+
+
+def test_gene_stats_of_an_empty_log(tmp_path):
+    write_meta(str(tmp_path))
+    generations, mean, std = GenerationHistory(str(tmp_path)).gene_stats(GENE)
+    assert len(generations) == len(mean) == len(std) == 0
+
+
+def test_columns_are_memory_mapped(tmp_path):
+    path = str(tmp_path)
+    write_log(path, [5, 3])
+    history = GenerationHistory(path)
+
+    for column in history.columns:
+        assert isinstance(column, np.memmap) and column._mmap is not None
+        assert not column.flags.writeable
+    assert history.gene_column(GENE) is history.columns[GENE]
+    assert np.shares_memory(history.stat("alive"), history.columns[-1])
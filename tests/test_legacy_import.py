@@ -0,0 +1,87 @@
+"""
+Incremental imports of legacy JSONL logs
+"""
+
+import json
+import shutil
+
+import numpy as np
+import pytest
+
+from enemy.chromosome import GENE_COUNT
+from visibility import GenerationHistory
+from visibility.legacy_import import STATE_FILE, import_jsonl, source_offsets
+
+
+def population(generation, size=3):
+    """Legacy chromosome dicts; small whole numbers survive every column dtype exactly"""
+    rng = np.random.default_rng(generation)
+    return [{str(gene): int(value) for gene, value in enumerate(rng.integers(0, 6, GENE_COUNT))}
+            for _ in range(size)]
+
+
+def line(generation):
+    return json.dumps({"generation": generation, "enemies": population(generation)}) + "\n"
+
+
+def write_source(path, generations, mode="w"):
+    with open(path, mode) as f:
+        f.write("".join(line(generation) for generation in generations))
+
+
+def assert_imported(dest, generations):
+    history = GenerationHistory(dest)
+    assert history.generations.tolist() == list(generations)
+    assert source_offsets(dest)[:, 0].tolist() == list(generations)
+    for generation in generations:
+        genes = [[chromosome[str(gene)] for gene in range(GENE_COUNT)] for chromosome in population(generation)]
+        assert np.array_equal(history.generation(generation)[:, :GENE_COUNT], genes)
+
+
+def test_reimport_picks_up_appended_lines(tmp_path):
+    source, dest = tmp_path / "log.jsonl", str(tmp_path / "log")
+    write_source(source, [1, 2, 3])
+    assert import_jsonl(source, dest) == 3
+    write_source(source, [4, 5], mode="a")
+    assert import_jsonl(source, dest) == 2
+    assert import_jsonl(source, dest) == 0
+    assert_imported(dest, [1, 2, 3, 4, 5])
+
+
+def test_trailing_line_without_newline_waits(tmp_path):
+    source, dest = tmp_path / "log.jsonl", str(tmp_path / "log")
+    partial = line(3)
+    write_source(source, [1, 2])
+    with open(source, "a") as f:
+        f.write(partial[:len(partial) // 2])
+    assert import_jsonl(source, dest) == 2
+    assert_imported(dest, [1, 2])
+
+    with open(source, "a") as f:
+        f.write(partial[len(partial) // 2:])
+    assert import_jsonl(source, dest) == 1
+    assert_imported(dest, [1, 2, 3])
+
+
+def test_crash_before_saving_state_does_not_duplicate(tmp_path):
+    source, dest = tmp_path / "log.jsonl", str(tmp_path / "log")
+    write_source(source, [1, 2])
+    import_jsonl(source, dest)
+    shutil.copy(f"{dest}/{STATE_FILE}", tmp_path / "state.json")
+
+    # The next import appends its records, then dies before saving its state
+    write_source(source, [3, 4], mode="a")
+    import_jsonl(source, dest)
+    shutil.copy(tmp_path / "state.json", f"{dest}/{STATE_FILE}")
+
+    assert import_jsonl(source, dest) == 2
+    assert_imported(dest, [1, 2, 3, 4])
+
+
+def test_shrunk_source_raises(tmp_path):
+    source, dest = tmp_path / "log.jsonl", str(tmp_path / "log")
+    write_source(source, [1, 2, 3])
+    import_jsonl(source, dest)
+    write_source(source, [1])
+    with pytest.raises(ValueError, match="shrank"):
+        import_jsonl(source, dest)
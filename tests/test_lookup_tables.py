@@ -0,0 +1,64 @@
+"""
+Accuracy of the enemy lookup tables against the functions they replace
+"""
+
+import math
+import random
+import numpy as np
+import pytest
+
+from enemy.lookup_tables import (PHASE_FRAMES, ZIGZAG_SIN, ZIGZAG_RATE, CIRCLE_COS, CIRCLE_SIN, CIRCLE_RATE,
+                                 ZIGZAG_SIN_ARRAY, CIRCLE_COS_ARRAY, CIRCLE_SIN_ARRAY, MIN_BULLET_SIZE,
+                                 BULLET_SIZE_RANGE, beta_parameters, beta_ppf, phase_table, sample_bullet_size)
+
+PHASE_TOLERANCE = 1e-12
+PPF_TOLERANCE = 1e-5
+KS_SAMPLES = 40000
+KS_BOUND = 0.02  # Measured worst case 0.012, mostly sampling noise at this size
+
+
+@pytest.mark.parametrize("table, rate, func", [
+    (ZIGZAG_SIN, ZIGZAG_RATE, math.sin),
+    (CIRCLE_COS, CIRCLE_RATE, math.cos),
+    (CIRCLE_SIN, CIRCLE_RATE, math.sin),
+])
+def test_phase_tables_max_error(table, rate, func):
+    error = max(abs(table[t] - func(t * rate)) for t in range(PHASE_FRAMES))
+    assert error <= PHASE_TOLERANCE
+
+
+@pytest.mark.parametrize("table, rate, func", [
+    (ZIGZAG_SIN_ARRAY, ZIGZAG_RATE, np.sin),
+    (CIRCLE_COS_ARRAY, CIRCLE_RATE, np.cos),
+    (CIRCLE_SIN_ARRAY, CIRCLE_RATE, np.sin),
+])
+def test_phase_table_lookup_past_the_table(table, rate, func):
+    time_alive = np.arange(PHASE_FRAMES - 100, PHASE_FRAMES + 100, dtype=float)
+    error = np.abs(phase_table(table, time_alive, rate, func) - func(time_alive * rate)).max()
+    assert error <= PHASE_TOLERANCE
+
+
+@pytest.mark.parametrize("a, b, exact", [
+    (1.0, 1.0, lambda p: p),
+    (0.5, 0.5, lambda p: np.sin(p * math.pi / 2) ** 2),
+    (0.3, 1.0, lambda p: p ** (1 / 0.3)),
+    (1.0, 0.2, lambda p: 1 - (1 - p) ** (1 / 0.2)),
+])
+def test_beta_ppf_closed_forms(a, b, exact):
+    p = np.linspace(0.0, 1.0, 257)
+    assert np.abs(beta_ppf(a, b) - exact(p)).max() <= PPF_TOLERANCE
+
+
+@pytest.mark.parametrize("bias", np.linspace(0.0, 1.0, 11).tolist())
+def test_bullet_sizes_follow_beta(bias):
+    """Two-sample Kolmogorov-Smirnov distance between table and random.betavariate sizes"""
+    rng = random.Random(int(bias * 1000))
+    alpha, beta = beta_parameters(bias)
+    exact = np.sort([rng.betavariate(alpha, beta) * BULLET_SIZE_RANGE + MIN_BULLET_SIZE
+                     for _ in range(KS_SAMPLES)])
+    table = np.sort([sample_bullet_size(bias, rng.random()) for _ in range(KS_SAMPLES)])
+
+    points = np.concatenate((exact, table))
+    distance = np.abs(np.searchsorted(exact, points, side="right") -
+                      np.searchsorted(table, points, side="right")).max() / KS_SAMPLES
+    assert distance <= KS_BOUND
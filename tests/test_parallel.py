@@ -0,0 +1,43 @@
+"""
+Worker episodes must play exactly like the in-process ones they stand in for
+"""
+
+from contextlib import nullcontext
+
+import pytest
+
+from enemy import Enemy
+from simulation import ParallelEvaluator, Simulation
+from simulation.parallel import STAT_FIELDS, evaluate_batch
+
+SEED = 5
+MAX_FRAMES = 300
+
+
+@pytest.mark.parametrize("use_world, batch_movement", [(False, False), (True, False), (False, True), (True, True)])
+def test_worker_batch_uses_the_episode_modes(use_world, batch_movement):
+    sim = Simulation(8, max_frames=MAX_FRAMES, seed=SEED, use_world=use_world, batch_movement=batch_movement)
+    enemies = sim.new_population()
+    chromosomes = [enemy.chromosome.copy() for enemy in enemies]
+
+    local = [Enemy(None, chromosome.copy()) for chromosome in chromosomes]
+    sim.seed_episode(local, 1)
+    sim.run_episode(local)
+    stats, frames = evaluate_batch(chromosomes, MAX_FRAMES, SEED, 1,
+                                   use_world=use_world, batch_movement=batch_movement)
+
+    assert frames == sim.frames_simulated
+    assert stats == [{field: getattr(enemy, field) for field in STAT_FIELDS} for enemy in local]
+
+
+def test_in_process_waves_match_workers():
+    """--workers 0 and --workers 1 give the same run: 30 enemies in waves of 10, seed 5"""
+    runs = []
+    for evaluator in (None, ParallelEvaluator(1, batch_size=10, max_frames=MAX_FRAMES)):
+        sim = Simulation(30, max_frames=MAX_FRAMES, seed=SEED, evaluator=evaluator, batch_size=10)
+        scored = []
+        with evaluator or nullcontext():
+            sim.run(2, on_generation=lambda generation, enemies: scored.append(
+                [(enemy.chromosome.to_array().tolist(), enemy.time_alive, enemy.damage_dealt) for enemy in enemies]))
+        runs.append(scored)
+    assert runs[0] == runs[1]
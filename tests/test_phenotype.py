@@ -0,0 +1,59 @@
+"""
+Enemy.phenotype follows edits of the chromosome
+"""
+
+import random
+
+from enemy import Enemy
+from enemy.gene_index import GeneIndex
+from enemy.phenotype import BASE_SPEED, BASE_BULLET_SPEED, BASE_BULLET_COOLDOWN, DAMAGE_PER_HIT
+
+
+def make_enemy():
+    return Enemy(None, rng=random.Random(0))
+
+
+def test_derived_stats_follow_in_place_gene_edits():
+    enemy = make_enemy()
+    enemy.chromosome[GeneIndex.SPEED] = 2.0
+    enemy.chromosome.bullet_speed = 1.5
+    enemy.chromosome[GeneIndex.FIRE_RATE] = 2.0
+    enemy.chromosome[GeneIndex.DAMAGE] = 0.5
+
+    assert enemy.speed == BASE_SPEED * 2.0
+    assert enemy.bullet_speed == BASE_BULLET_SPEED * 1.5
+    assert enemy.bullet_cooldown_max == int(BASE_BULLET_COOLDOWN / 2.0)
+    assert enemy.phenotype.damage_per_hit == DAMAGE_PER_HIT * 0.5
+
+
+def test_behaviors_follow_in_place_gene_edits():
+    enemy = make_enemy()
+    for behavior in range(20):
+        enemy.chromosome[behavior] = 0
+    enemy.chromosome[GeneIndex.CIRCLE] = 1
+    assert enemy.phenotype.behaviors == (GeneIndex.CIRCLE,)
+
+
+def test_phenotype_is_reused_until_a_gene_changes():
+    enemy = make_enemy()
+    phenotype = enemy.phenotype
+    assert enemy.phenotype is phenotype
+    enemy.chromosome[GeneIndex.ACCURACY] = 0.9
+    assert enemy.phenotype is not phenotype
+    assert enemy.phenotype.accuracy == 0.9
+
+
+def test_scoring_reads_edited_genes_and_keeps_the_phenotype():
+    enemy = make_enemy()
+    for gene in range(20):
+        enemy.chromosome[gene] = 0.0
+    enemy.calculate_fitness()
+    base = enemy.fitness
+
+    enemy.chromosome[0] = 1.0
+    enemy.chromosome[2] = 1.0  # Active, but not counted towards behavior variety
+    phenotype = enemy.phenotype
+    enemy.calculate_fitness()
+    assert enemy.fitness == base + 5
+    assert enemy.chromosome[59] == enemy.fitness
+    assert enemy.phenotype is phenotype
@@ -4,10 +4,17 @@ from .generation_summary import show_generation_summary
 from .enemy_info_box import show_enemy_info
 from .info_overlay import show_info_overlay
 from .game_over import show_game_over
+from .profiler_panel import show_profiler_panel
+from .text_cache import get_font, render_text, Label, TextCache
 
 __all__ = [
     "show_generation_summary",
     "show_enemy_info",
     "show_info_overlay",
     "show_game_over",
+    "show_profiler_panel",
+    "get_font",
+    "render_text",
+    "Label",
+    "TextCache",
 ]
@@ -1,10 +1,17 @@
 import pygame
 from constants import *
+from ui.text_cache import Label
+
+_generation_label = Label()
+_enemies_label = Label()
+_health_label = Label()
 
 def show_info_overlay(screen, player, enemies, font, generation):
-    screen.blit(font.render(f"Generation: {generation}", True, WHITE), (10, 10))
+    """Returns the rects drawn to"""
+    gen_rect = _generation_label.draw(screen, font, f"Generation: {generation}", WHITE, (10, 10))
     alive = len([e for e in enemies if e.alive])
-    screen.blit(font.render(f"Enemies: {alive}/{len(enemies)}", True, WHITE), (10, 40))
+    enemies_rect = _enemies_label.draw(screen, font, f"Enemies: {alive}/{len(enemies)}", WHITE, (10, 40))
     health = f"{player.health}/{player.max_health}"
-    h_text = font.render(f"Health: {health}", True, WHITE)
-    screen.blit(h_text, (SCREEN_WIDTH - h_text.get_width() - 10, 10))
+    h_text = _health_label.update(font, f"Health: {health}", WHITE)
+    health_rect = screen.blit(h_text, (SCREEN_WIDTH - h_text.get_width() - 10, 10))
+    return [gen_rect, enemies_rect, health_rect]
@@ -0,0 +1,32 @@
+import pygame
+from constants import *
+from ui.text_cache import render_text
+
+COLUMNS = ("p50", "p95", "p99")
+
+def show_profiler_panel(screen, profiler, font):
+    """Returns the panel's rect, or None when profiling is off"""
+    if not profiler.enabled:
+        return None
+    names = profiler.names()
+    line_h = font.get_linesize()
+    box_w, box_h = 280, (len(names) + 1) * line_h + 10
+    x, y = SCREEN_WIDTH - box_w - 10, 40
+
+    panel = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 180))
+    screen.blit(panel, (x, y))
+
+    # Timings are right-aligned in fixed columns
+    screen.blit(render_text(font, "Frame (ms)", YELLOW), (x + 5, y + 5))
+    for col, label in enumerate(COLUMNS):
+        text = render_text(font, label, YELLOW)
+        screen.blit(text, (x + 160 + col * 40 - text.get_width(), y + 5))
+
+    for row, name in enumerate(names, 1):
+        row_y = y + 5 + row * line_h
+        screen.blit(render_text(font, name, WHITE), (x + 5, row_y))
+        for col, value in enumerate(profiler.percentiles(name)):
+            text = render_text(font, f"{value:.2f}", WHITE)
+            screen.blit(text, (x + 160 + col * 40 - text.get_width(), row_y))
+    return pygame.Rect(x, y, box_w, box_h)
@@ -0,0 +1,77 @@
+"""
+Text rendering cache for the per-frame UI. Fonts come from one shared
+registry, rendered strings are kept in an LRU keyed by
+(text, font, color, antialias), and Labels skip even the cache lookup
+while their text has not changed.
+"""
+
+from collections import OrderedDict
+import pygame
+
+_fonts = {}
+
+
+def get_font(name='Arial', size=16):
+    """Shared SysFont, looked up once per (name, size)"""
+    font = _fonts.get((name, size))
+    if font is None:
+        font = _fonts[(name, size)] = pygame.font.SysFont(name, size)
+    return font
+
+
+class TextCache:
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, antialias, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """Drop-in for font.render(text, antialias, color) through the shared cache"""
+    return text_cache.render(font, text, color, antialias)
+
+
+class Label:
+    """
+    A fixed spot on screen whose text changes now and then (generation,
+    health, ...). draw() re-rasterizes only when the text or color differs
+    from the previous frame and otherwise reblits the same surface.
+    """
+
+    __slots__ = ("font", "text", "color", "surface")
+
+    def __init__(self, font=None):
+        self.font = font
+        self.text = None
+        self.color = None
+        self.surface = None
+
+    def update(self, font, text, color):
+        if text != self.text or color != self.color or font is not self.font:
+            self.font, self.text, self.color = font, text, color
+            self.surface = render_text(font, text, color)
+        return self.surface
+
+    def draw(self, screen, font, text, color, pos):
+        return screen.blit(self.update(font, text, color), pos)
@@ -0,0 +1,14 @@
+# visibility/__init__.py
+
+from .visibility_logger import GenerationLogger, log_generation
+from .history_reader import GenerationHistory
+from .legacy_import import import_jsonl
+from .frame_profiler import FrameProfiler
+
+__all__ = [
+    "GenerationLogger",
+    "log_generation",
+    "GenerationHistory",
+    "import_jsonl",
+    "FrameProfiler",
+]
@@ -0,0 +1,129 @@
+"""
+Per-frame timing scopes for the game loop.
+
+    with profiler.scope("enemy_move"):
+        enemy.move(...)
+
+Scopes with the same name add up within a frame (the per-enemy calls in
+the enemy loop become one enemy_move total); end_frame() files each total
+into a rolling window for percentiles. While disabled, scope() hands back
+a shared no-op context manager and nothing is timed or stored.
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+
+DEFAULT_PROFILE_DIR = os.path.join("logs", "profile")
+
+
+class _NullScope:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        profiler = self.profiler
+        profiler.totals[self.name] = profiler.totals.get(self.name, 0) + end - self.start
+        profiler.events.append((self.name, self.start, end))
+        return False
+
+
+class FrameProfiler:
+    """
+    Keeps the last `window` frames: per-scope totals for percentiles and
+    CSV export, and the individual scope events for a Chrome trace.
+    """
+
+    def __init__(self, enabled=False, window=300):
+        self.enabled = enabled
+        self.window = window
+        self.scopes = {}
+        self.totals = {}
+        self.events = []
+        self.frame = 0
+        self.history = deque(maxlen=window)  # (frame, {name: ns})
+        self.trace = deque(maxlen=window)    # (frame, [(name, start_ns, end_ns)])
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.totals = {}
+        self.events = []
+
+    def scope(self, name):
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = _Scope(self, name)
+        return scope
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.history.append((self.frame, self.totals))
+        self.trace.append((self.frame, self.events))
+        self.totals = {}
+        self.events = []
+        self.frame += 1
+
+    def names(self):
+        """Scope names in the order they were first seen"""
+        return list(self.scopes)
+
+    def percentiles(self, name, quantiles=(50, 95, 99)):
+        """Rolling percentiles of a scope's per-frame total, in milliseconds"""
+        samples = sorted(totals.get(name, 0) for _, totals in self.history)
+        if not samples:
+            return tuple(0.0 for _ in quantiles)
+        last = len(samples) - 1
+        return tuple(samples[min(last, round(q / 100 * last))] / 1e6 for q in quantiles)
+
+    def export_csv(self, path):
+        """One row per frame, one column (ms) per scope"""
+        names = self.names()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + names)
+            for frame, totals in self.history:
+                writer.writerow([frame] + [f"{totals.get(name, 0) / 1e6:.4f}" for name in names])
+
+    def export_chrome_trace(self, path):
+        """Trace Event Format file for chrome://tracing or Perfetto"""
+        events = []
+        for _, frame_events in self.trace:
+            for name, start, end in frame_events:
+                events.append({"name": name, "ph": "X", "ts": start / 1e3, "dur": (end - start) / 1e3,
+                               "pid": 0, "tid": 0})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export(self, directory=DEFAULT_PROFILE_DIR):
+        """Write frames.csv and trace.json to `directory`; returns their paths"""
+        os.makedirs(directory, exist_ok=True)
+        csv_path = os.path.join(directory, "frames.csv")
+        trace_path = os.path.join(directory, "trace.json")
+        self.export_csv(csv_path)
+        self.export_chrome_trace(trace_path)
+        return csv_path, trace_path
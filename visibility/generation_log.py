@@ -0,0 +1,154 @@
+"""
+Binary generation log layout, shared by the logger, the history reader and
+the legacy JSONL importer.
+
+A log is a directory holding:
+  meta.json    - format version and the column layout
+  columns/     - one flat file per record column (60 genes followed by the
+                 episode stats), each in the narrowest dtype that holds the
+                 column (see COLUMNS), appended in generation order
+  index.i64    - one (generation, first_record, record_count) int64 row per
+                 logged generation
+
+Every column file can be memory-mapped on its own. Records are always
+written before their index row, so a reader that only trusts the index
+never sees a half-written generation.
+"""
+
+import json
+import os
+import numpy as np
+from enemy.chromosome import GENE_COUNT
+
+FORMAT_VERSION = 3
+STAT_COLUMNS = ("time_alive", "damage_dealt", "hits_scored", "shots_fired", "distance_moved", "alive")
+RECORD_WIDTH = GENE_COUNT + len(STAT_COLUMNS)
+RECORD_DTYPE = np.float32
+INDEX_DTYPE = np.int64
+INDEX_WIDTH = 3
+# Integer stats the legacy logs do not have are stored as this
+MISSING = -1
+
+# Column storage: behavior toggles are only ever tested for "== 1", so
+# float16 (0 and 1 exact, anything else to within 5e-4) is enough; the
+# integer genes (20-39, 44, 48-51, 57) and the counting stats are whole
+# numbers; everything else stays float32
+_GENE_DTYPES = ([np.float16] * 20 + [np.uint8] * 20 + [np.float32] * 4 + [np.uint8] + [np.float32] * 3 +
+                [np.uint8] * 4 + [np.float32] * 5 + [np.uint8] + [np.float32] * 2)
+_STAT_DTYPES = {"time_alive": np.int32, "damage_dealt": np.float32, "hits_scored": np.int16,
+                "shots_fired": np.int16, "distance_moved": np.float32, "alive": np.int8}
+COLUMNS = tuple([(f"gene_{gene:02d}", np.dtype(dtype)) for gene, dtype in enumerate(_GENE_DTYPES)] +
+                [(name, np.dtype(_STAT_DTYPES[name])) for name in STAT_COLUMNS])
+
+META_FILE = "meta.json"
+COLUMNS_DIR = "columns"
+INDEX_FILE = "index.i64"
+
+
+def stat_column(name):
+    """Record column holding an episode stat"""
+    return GENE_COUNT + STAT_COLUMNS.index(name)
+
+
+def column_path(path, column):
+    name, dtype = COLUMNS[column]
+    return os.path.join(path, COLUMNS_DIR, f"{name}.{dtype.str[1:]}")
+
+
+def population_records(enemies):
+    """(N, RECORD_WIDTH) float32 block of genes + stats for a population"""
+    block = np.zeros((len(enemies), RECORD_WIDTH), dtype=RECORD_DTYPE)
+    for row, enemy in enumerate(enemies):
+        block[row, :GENE_COUNT] = enemy.chromosome.to_array()
+        block[row, GENE_COUNT:] = [getattr(enemy, name) for name in STAT_COLUMNS]
+    return block
+
+
+def to_column(values, dtype):
+    """One record column converted to its storage dtype; NaN becomes MISSING in integer columns"""
+    if dtype == np.float16:
+        stored = values.astype(dtype)
+        # Keep "== 1" meaning an active behavior: nothing else may round up to 1
+        stored[(stored == 1) & (values != 1)] = np.nextafter(np.float16(1), np.float16(0))
+        return stored
+    if dtype.kind == "f":
+        return values.astype(dtype)
+    return np.where(np.isnan(values), MISSING, np.rint(values)).astype(dtype)
+
+
+def write_meta(path):
+    meta = {
+        "version": FORMAT_VERSION,
+        "gene_count": GENE_COUNT,
+        "stat_columns": list(STAT_COLUMNS),
+        "columns": [[name, dtype.str] for name, dtype in COLUMNS],
+        "index_dtype": np.dtype(INDEX_DTYPE).str,
+    }
+    os.makedirs(os.path.join(path, COLUMNS_DIR), exist_ok=True)
+    with open(os.path.join(path, META_FILE), "w") as f:
+        json.dump(meta, f, indent=2)
+
+
+def read_meta(path):
+    with open(os.path.join(path, META_FILE)) as f:
+        meta = json.load(f)
+    if meta["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported generation log version {meta['version']}")
+    return meta
+
+
+def read_index(path):
+    """(generations, INDEX_WIDTH) index table; a partly written last row is ignored"""
+    index_path = os.path.join(path, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return np.zeros((0, INDEX_WIDTH), dtype=INDEX_DTYPE)
+    rows = os.path.getsize(index_path) // (INDEX_WIDTH * np.dtype(INDEX_DTYPE).itemsize)
+    return np.fromfile(index_path, dtype=INDEX_DTYPE, count=rows * INDEX_WIDTH).reshape(rows, INDEX_WIDTH)
+
+
+def record_count(index):
+    """Records covered by an index table"""
+    return int((index[:, 1] + index[:, 2]).max()) if len(index) else 0
+
+
+def append_blocks(path, blocks):
+    """
+    Append [(generation, block), ...] to the log at `path` (must already hold
+    meta.json). Returns the number of records written.
+    """
+    first = record_count(read_index(path))
+
+    index_rows = []
+    count = 0
+    for generation, block in blocks:
+        index_rows.append((generation, first + count, len(block)))
+        count += len(block)
+
+    if count:
+        records = np.concatenate([block for _, block in blocks if len(block)])
+        for column, (_, dtype) in enumerate(COLUMNS):
+            file_path = column_path(path, column)
+            # Overwrite anything past the indexed records, e.g. left by a crash mid-append
+            with open(file_path, "r+b" if os.path.exists(file_path) else "wb") as f:
+                f.seek(first * dtype.itemsize)
+                f.write(to_column(records[:, column], dtype).tobytes())
+                f.truncate()
+
+    if index_rows:
+        with open(os.path.join(path, INDEX_FILE), "ab") as f:
+            f.write(np.array(index_rows, dtype=INDEX_DTYPE).reshape(-1, INDEX_WIDTH).tobytes())
+    return count
+
+
+def truncate_log(path, records, generations):
+    """Cut the log back to its first `records` records and `generations` index rows"""
+    truncate_file(os.path.join(path, INDEX_FILE), generations * INDEX_WIDTH * np.dtype(INDEX_DTYPE).itemsize)
+    for column, (_, dtype) in enumerate(COLUMNS):
+        truncate_file(column_path(path, column), records * dtype.itemsize)
+
+
+def truncate_file(path, size):
+    """Shorten a file to `size` bytes if it is longer"""
+    if os.path.exists(path) and os.path.getsize(path) > size:
+        with open(path, "r+b") as f:
+            f.truncate(size)
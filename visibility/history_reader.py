@@ -0,0 +1,117 @@
+"""
+Memory-mapped access to a binary generation log (see generation_log.py).
+Nothing is read up front: every column file is mapped on its own, columns
+are views into the mapping and the OS pages in only what a query touches.
+"""
+
+import os
+import numpy as np
+from enemy.gene_index import GeneIndex
+from visibility.generation_log import (
+    COLUMNS, RECORD_DTYPE, RECORD_WIDTH, column_path, read_index, read_meta, record_count, stat_column,
+)
+
+
+class GenerationHistory:
+    def __init__(self, path):
+        self.path = path
+        self.meta = read_meta(path)
+        self.refresh()
+
+    def refresh(self):
+        """Re-map the files to pick up generations appended since opening"""
+        self.index = read_index(self.path)
+
+        # Only records covered by the index are complete
+        self.count = record_count(self.index)
+        self.columns = [np.memmap(column_path(self.path, column), dtype=dtype, mode="r", shape=(self.count,))
+                        if self.count else np.zeros(0, dtype=dtype)
+                        for column, (_, dtype) in enumerate(COLUMNS)]
+        self._record_generation = None
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def generations(self):
+        return self.index[:, 0]
+
+    def rows(self, start, stop):
+        """(stop - start, RECORD_WIDTH) float32 copy of a range of records: genes, then stats"""
+        block = np.empty((max(0, min(stop, self.count) - start), RECORD_WIDTH), dtype=RECORD_DTYPE)
+        for column, values in enumerate(self.columns):
+            block[:, column] = values[start:stop]
+        return block
+
+    def gene_column(self, gene):
+        """Zero-copy view of one gene across every logged enemy, in its storage dtype"""
+        return self.columns[int(gene)]
+
+    def stat(self, name):
+        """
+        Zero-copy view of one episode stat (e.g. 'damage_dealt') across every
+        logged enemy; records imported from legacy logs hold NaN or MISSING
+        """
+        return self.columns[stat_column(name)]
+
+    @property
+    def record_generation(self):
+        """Generation number of every record"""
+        if self._record_generation is None:
+            self._record_generation = np.repeat(self.index[:, 0], self.index[:, 2])
+        return self._record_generation
+
+    def generation(self, generation, occurrence=-1):
+        """
+        Records of one generation. A log can hold several runs that each
+        restart at generation 1; occurrence picks which one (default: last).
+        """
+        rows = np.flatnonzero(self.index[:, 0] == generation)
+        if not len(rows):
+            raise KeyError(f"Generation {generation} not in log")
+        _, first, count = self.index[rows[occurrence]]
+        return self.rows(first, first + count)
+
+    def gene_stats(self, gene):
+        """
+        Per logged generation (index row): (generations, mean, std) of one
+        gene. Generations logged with no records get NaN.
+        """
+        counts = self.index[:, 2]
+        mean = np.full(len(counts), np.nan)
+        std = np.full(len(counts), np.nan)
+        rows = np.flatnonzero(counts > 0)
+        if len(rows):
+            # reduceat over explicit [start, end) pairs; the padding keeps
+            # every bound a valid index
+            column = np.zeros(self.count + 1)
+            column[:-1] = self.gene_column(gene)
+            starts = self.index[rows, 1]
+            bounds = np.column_stack((starts, starts + counts[rows])).ravel()
+            sums = np.add.reduceat(column, bounds)[::2]
+            squares = np.add.reduceat(column * column, bounds)[::2]
+            mean[rows] = sums / counts[rows]
+            std[rows] = np.sqrt(np.maximum(squares / counts[rows] - mean[rows] ** 2, 0))
+        return self.index[:, 0], mean, std
+
+    def top_k(self, k, first_generation=None, last_generation=None):
+        """
+        The k fittest records in a generation range, best first, as
+        (generation, record_number, fitness) tuples; fetch the record with
+        self.rows(record_number, record_number + 1).
+        """
+        gen = self.record_generation
+        selected = np.ones(len(gen), dtype=bool)
+        if first_generation is not None:
+            selected &= gen >= first_generation
+        if last_generation is not None:
+            selected &= gen <= last_generation
+
+        candidates = np.flatnonzero(selected)
+        if not len(candidates):
+            return []
+        fitness = self.gene_column(GeneIndex.FITNESS)[candidates]
+        k = min(k, len(candidates))
+        best = np.argpartition(-fitness, k - 1)[:k]
+        best = best[np.argsort(-fitness[best], kind="stable")]
+        return [(int(gen[candidates[i]]), int(candidates[i]), float(fitness[i])) for i in best]
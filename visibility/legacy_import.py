@@ -0,0 +1,150 @@
+"""
+Importer for the legacy all_generations.jsonl logs into the binary
+generation log format (see generation_log.py).
+
+Each JSONL line is {"generation": g, "enemies": [chromosome, ...]} where a
+chromosome is a dict with string keys: sparse for fresh enemies, dense for
+bred ones. Genes are normalized onto the dense GENE_COUNT layout (missing
+genes read as 0, like Chromosome does); the legacy files carry no episode
+stats, so those columns are NaN (MISSING in the integer stat columns).
+
+Imports are incremental: the destination keeps the byte offset already
+consumed, so re-running on a growing file only parses the new lines.
+"""
+
+import argparse
+import json
+import os
+import numpy as np
+from enemy.chromosome import GENE_COUNT
+from enemy.gene_index import GeneIndex
+from visibility.generation_log import (
+    INDEX_DTYPE, META_FILE, RECORD_DTYPE, RECORD_WIDTH, append_blocks, truncate_file, truncate_log, write_meta,
+)
+
+STATE_FILE = "import_state.json"
+# (generation, byte offset of its line in the source) per imported line
+OFFSETS_FILE = "source_offsets.i64"
+
+
+def gene_number(key):
+    """Column for a legacy gene key: a number ("42") or a GeneIndex name ("ACCURACY")"""
+    if isinstance(key, str) and not key.lstrip("-").isdigit():
+        return int(GeneIndex[key.upper()])
+    number = int(key)
+    if not 0 <= number < GENE_COUNT:
+        raise ValueError(f"Gene {key} outside the {GENE_COUNT}-gene layout")
+    return number
+
+
+def normalize_population(enemies):
+    """(N, RECORD_WIDTH) float32 block from a list of legacy chromosome dicts"""
+    block = np.zeros((len(enemies), RECORD_WIDTH), dtype=RECORD_DTYPE)
+    block[:, GENE_COUNT:] = np.nan
+    for row, chromosome in enumerate(enemies):
+        for key, value in chromosome.items():
+            block[row, gene_number(key)] = value
+    return block
+
+
+def read_state(path):
+    state_path = os.path.join(path, STATE_FILE)
+    if not os.path.exists(state_path):
+        return {"source": None, "offset": 0, "records": 0, "generations": 0, "lines": 0}
+    with open(state_path) as f:
+        return json.load(f)
+
+
+def write_state(path, state):
+    """Atomically replace the import state"""
+    tmp_path = os.path.join(path, STATE_FILE + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, os.path.join(path, STATE_FILE))
+
+
+def _rollback(path, state):
+    """
+    Drop anything written after the last saved state, so an import that
+    died between appending and saving its state does not duplicate rows
+    """
+    truncate_log(path, state["records"], state["generations"])
+    truncate_file(os.path.join(path, OFFSETS_FILE), state["lines"] * 2 * np.dtype(INDEX_DTYPE).itemsize)
+
+
+def import_jsonl(source, path, chunk_lines=256):
+    """
+    Import the lines of `source` appended since the last import into the log
+    directory `path`. A trailing line without a newline is still being
+    written and is left for the next run. Returns the number of generations
+    imported.
+    """
+    os.makedirs(path, exist_ok=True)
+    if not os.path.exists(os.path.join(path, META_FILE)):
+        write_meta(path)
+
+    state = read_state(path)
+    source = os.path.abspath(source)
+    if state["source"] not in (None, source):
+        raise ValueError(f"{path} was imported from {state['source']}, not {source}")
+    if os.path.getsize(source) < state["offset"]:
+        raise ValueError(f"{source} shrank since the last import; import it into a fresh directory")
+    state["source"] = source
+    _rollback(path, state)
+
+    imported = 0
+    with open(source, "rb") as f:
+        f.seek(state["offset"])
+        offset = state["offset"]
+        blocks, offsets = [], []
+
+        def flush():
+            nonlocal imported
+            if blocks:
+                state["records"] += append_blocks(path, blocks)
+                state["generations"] += len(blocks)
+            if offsets:
+                with open(os.path.join(path, OFFSETS_FILE), "ab") as out:
+                    out.write(np.array(offsets, dtype=INDEX_DTYPE).tobytes())
+                state["lines"] += len(offsets)
+            state["offset"] = offset
+            write_state(path, state)
+            imported += len(blocks)
+            blocks.clear()
+            offsets.clear()
+
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                entry = json.loads(line)
+                blocks.append((entry["generation"], normalize_population(entry["enemies"])))
+                offsets.append((entry["generation"], offset))
+            offset += len(line)
+            if len(blocks) >= chunk_lines:
+                flush()
+        flush()
+
+    return imported
+
+
+def source_offsets(path):
+    """(lines, 2) array of (generation, byte offset in the source JSONL)"""
+    offsets_path = os.path.join(path, OFFSETS_FILE)
+    if not os.path.exists(offsets_path):
+        return np.zeros((0, 2), dtype=INDEX_DTYPE)
+    return np.fromfile(offsets_path, dtype=INDEX_DTYPE).reshape(-1, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a legacy JSONL generation log")
+    parser.add_argument("source", help="all_generations.jsonl to import")
+    parser.add_argument("dest", help="binary generation log directory")
+    args = parser.parse_args()
+
+    count = import_jsonl(args.source, args.dest)
+    print(f"Imported {count} generations from {args.source} into {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
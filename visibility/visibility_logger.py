@@ -0,0 +1,80 @@
+"""
+Streaming generation logger: snapshots are queued from the game loop and a
+background thread appends them to the binary log in batched flushes
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from visibility.generation_log import META_FILE, append_blocks, population_records, write_meta
+
+DEFAULT_LOG_DIR = os.path.join("logs", "generations")
+
+
+class GenerationLogger:
+    """
+    log() only copies the population into a float32 block and queues it, so
+    it never waits on disk. The writer thread flushes whenever flush_rows
+    records are pending or flush_interval seconds have passed.
+    """
+
+    def __init__(self, path=DEFAULT_LOG_DIR, flush_rows=4096, flush_interval=2.0):
+        self.path = path
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        os.makedirs(path, exist_ok=True)
+        if not os.path.exists(os.path.join(path, META_FILE)):
+            write_meta(path)
+
+        self.queue = queue.Queue()
+        self.records_written = 0
+        self.thread = threading.Thread(target=self._run, name="generation-logger", daemon=True)
+        self.thread.start()
+
+    def log(self, enemies, generation):
+        self.queue.put((generation, population_records(enemies)))
+
+    def close(self):
+        """Flush everything still queued and stop the writer thread"""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def _run(self):
+        pending = []
+        pending_rows = 0
+        last_flush = time.monotonic()
+        running = True
+
+        while running:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                running = False
+            elif item:
+                pending.append(item)
+                pending_rows += len(item[1])
+
+            now = time.monotonic()
+            if pending and (pending_rows >= self.flush_rows or now - last_flush >= self.flush_interval or not running):
+                self.records_written += append_blocks(self.path, pending)
+                pending = []
+                pending_rows = 0
+                last_flush = now
+
+
+_default_logger = None
+
+
+def log_generation(enemies, generation, path=DEFAULT_LOG_DIR):
+    """Queue a scored generation on the shared logger (flushed at exit)"""
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = GenerationLogger(path)
+        atexit.register(_default_logger.close)
+    _default_logger.log(enemies, generation)
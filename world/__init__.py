@@ -0,0 +1,18 @@
+# world/__init__.py
+
+from .spatial_grid import SpatialGrid, FrameIndex
+from .collision import find_hits, grid_broad_phase, aabb_overlap, box_overlap
+from .world_state import WorldState, BulletArrays, BulletListView, PLAYER_OWNER
+
+__all__ = [
+    "WorldState",
+    "BulletArrays",
+    "BulletListView",
+    "PLAYER_OWNER",
+    "SpatialGrid",
+    "FrameIndex",
+    "find_hits",
+    "grid_broad_phase",
+    "aabb_overlap",
+    "box_overlap",
+]
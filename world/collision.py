@@ -0,0 +1,99 @@
+"""
+Broad-phase + narrow-phase collision between sets of axis-aligned boxes.
+Boxes are given as (N, 2) top-left positions and (N, 2) sizes, the same
+layout WorldState keeps for bullets and enemies.
+"""
+
+import numpy as np
+
+EMPTY_PAIRS = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp))
+
+# Up to this many a x b pairs, testing every pair at once is cheaper than
+# hashing into the grid
+BRUTE_FORCE_PAIRS = 4096
+
+
+def _expand_runs(a_rows, lo, hi, order):
+    """Turn per-a [lo, hi) runs into the sorted b array into explicit (a_idx, b_idx) pairs"""
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    a_idx = np.repeat(a_rows, counts)
+    run_start = np.repeat(np.cumsum(counts) - counts, counts)
+    b_idx = order[np.repeat(lo, counts) + np.arange(total) - run_start]
+    return a_idx, b_idx
+
+
+def grid_broad_phase(a_pos, a_size, b_pos, b_size):
+    """
+    Broad phase: hash b into square cells at least as large as any box, so
+    each a can only touch b in its own cell or the eight around it. Returns
+    candidate (a_idx, b_idx) pairs.
+    """
+    if not len(a_pos) or not len(b_pos):
+        return EMPTY_PAIRS
+    if len(a_pos) > len(b_pos):
+        # Hash the larger set and probe with the smaller one
+        b_idx, a_idx = grid_broad_phase(b_pos, b_size, a_pos, a_size)
+        return a_idx, b_idx
+
+    cell = max(a_size.max(), b_size.max(), 1.0)
+    a_cell = np.floor(a_pos / cell).astype(np.int64)
+    b_cell = np.floor(b_pos / cell).astype(np.int64)
+
+    # Flatten (column, row) into one sortable key, leaving a margin of one
+    # cell on every side for the neighbor offsets
+    origin = np.minimum(a_cell.min(axis=0), b_cell.min(axis=0)) - 1
+    columns = int(max(a_cell[:, 0].max(), b_cell[:, 0].max()) - origin[0]) + 3
+    a_cell -= origin
+    b_cell -= origin
+
+    b_key = b_cell[:, 1] * columns + b_cell[:, 0]
+    order = np.argsort(b_key, kind="stable")
+    sorted_keys = b_key[order]
+    a_rows = np.arange(len(a_pos))
+
+    a_parts, b_parts = [], []
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            key = (a_cell[:, 1] + dy) * columns + a_cell[:, 0] + dx
+            lo = np.searchsorted(sorted_keys, key, side="left")
+            hi = np.searchsorted(sorted_keys, key, side="right")
+            a_idx, b_idx = _expand_runs(a_rows, lo, hi, order)
+            a_parts.append(a_idx)
+            b_parts.append(b_idx)
+
+    return np.concatenate(a_parts), np.concatenate(b_parts)
+
+
+def box_overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Strict overlap test for one pair of boxes, the scalar form of aabb_overlap"""
+    return ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by
+
+
+def aabb_overlap(a_pos, a_size, b_pos, b_size):
+    """Narrow phase: element-wise strict AABB overlap test for paired boxes"""
+    return ((a_pos[:, 0] < b_pos[:, 0] + b_size[:, 0]) &
+            (a_pos[:, 0] + a_size[:, 0] > b_pos[:, 0]) &
+            (a_pos[:, 1] < b_pos[:, 1] + b_size[:, 1]) &
+            (a_pos[:, 1] + a_size[:, 1] > b_pos[:, 1]))
+
+
+def find_hits(a_pos, a_size, b_pos, b_size):
+    """
+    All overlapping (a_idx, b_idx) pairs between two box sets, ordered by a
+    then b so callers can resolve hits in the same order as nested loops.
+    """
+    if len(a_pos) * len(b_pos) <= BRUTE_FORCE_PAIRS:
+        a_x, a_y = a_pos[:, 0, None], a_pos[:, 1, None]
+        hit = ((a_x < b_pos[:, 0] + b_size[:, 0]) & (a_x + a_size[:, 0, None] > b_pos[:, 0]) &
+               (a_y < b_pos[:, 1] + b_size[:, 1]) & (a_y + a_size[:, 1, None] > b_pos[:, 1]))
+        return np.nonzero(hit)  # Row-major: already ordered by a, then b
+
+    a_idx, b_idx = grid_broad_phase(a_pos, a_size, b_pos, b_size)
+    if not len(a_idx):
+        return EMPTY_PAIRS
+
+    hit = aabb_overlap(a_pos[a_idx], a_size[a_idx], b_pos[b_idx], b_size[b_idx])
+    a_idx, b_idx = a_idx[hit], b_idx[hit]
+    order = np.lexsort((b_idx, a_idx))
+    return a_idx[order], b_idx[order]
@@ -0,0 +1,80 @@
+"""
+Uniform-grid spatial hash for neighbor queries, rebuilt once per frame
+"""
+
+import math
+
+# Cell edge in pixels: a few enemy widths, so a query scans the cells its
+# circle actually covers instead of a third of the field. Neighbor radii go
+# up to 300 (gene 55 OPTIMAL_PROXIMITY tops out at 200, scanned at 1.5x).
+CELL_SIZE = 64
+
+# Enemies keep moving while the per-object loop runs, so enemy queries are
+# widened by the furthest an enemy can travel in one frame:
+# base speed 1.2 * max speed gene 3.0 * max variance factor 2.0
+MAX_ENEMY_STEP = 1.2 * 3.0 * 2.0
+
+
+class SpatialGrid:
+    """
+    Buckets items into square cells. query() returns the items from every
+    cell overlapping a circle. The order is deterministic (cells row by row,
+    insertion order within a cell) but not the order of a full scan.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE, slack=0.0):
+        self.cell_size = cell_size
+        self.slack = slack
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, item, x, y):
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = bucket = []
+        bucket.append(item)
+
+    def rebuild(self, items, positions):
+        self.clear()
+        for item, (x, y) in zip(items, positions):
+            self.insert(item, x, y)
+
+    def query(self, x, y, radius):
+        r = radius + self.slack
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for cy in range(int((y - r) // size), int((y + r) // size) + 1):
+            # Widest part of the circle inside this row of cells
+            top = cy * size
+            if y < top:
+                gap = top - y
+            elif y > top + size:
+                gap = y - top - size
+            else:
+                gap = 0.0
+            half = math.sqrt(max(0.0, r * r - gap * gap))
+            for cx in range(int((x - half) // size), int((x + half) // size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
+class FrameIndex:
+    """
+    Per-frame spatial indexes shared by group behavior and DODGE. Build it
+    from the alive enemies at the top of the frame, then call
+    index_player_bullets() once the player's bullets have been updated.
+    """
+
+    def __init__(self, enemies):
+        self.enemies = SpatialGrid(slack=MAX_ENEMY_STEP)
+        self.enemies.rebuild(enemies, ((e.x, e.y) for e in enemies))
+        self.player_bullets = SpatialGrid()
+
+    def index_player_bullets(self, bullets):
+        self.player_bullets.rebuild(bullets, ((b['x'], b['y']) for b in bullets))
@@ -0,0 +1,232 @@
+"""
+Structure-of-arrays world state: enemy bullets and player bullets live in
+contiguous NumPy arrays so movement, culling and collision run as
+vectorized operations once per frame instead of one dict at a time.
+Enemies stay plain objects; their boxes are read into an array each frame.
+"""
+
+import numpy as np
+from constants import *
+from world.collision import find_hits, aabb_overlap
+from bullet_pool import bullet_pool
+
+PLAYER_OWNER = -1  # Owner id used for player bullets
+EMPTY_INDICES = np.zeros(0, dtype=np.intp)
+
+
+class BulletArrays:
+    """Growable bullet store: positions, velocities, sizes, owner ids and an alive mask"""
+
+    def __init__(self, capacity=256):
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.size = np.zeros((capacity, 2))
+        self.owner = np.full(capacity, PLAYER_OWNER, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.count = 0
+        self._groups = None  # owner -> live indices, dropped whenever bullets change
+
+    def _grow(self):
+        capacity = len(self.alive) * 2
+        for name in ("pos", "vel", "size", "owner", "alive"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, x, y, dx, dy, width, height, owner=PLAYER_OWNER):
+        if self.count == len(self.alive):
+            self._grow()
+        i = self.count
+        self.pos[i] = x, y
+        self.vel[i] = dx, dy
+        self.size[i] = width, height
+        self.owner[i] = owner
+        self.alive[i] = True
+        self.count += 1
+        self._groups = None
+        return i
+
+    def add_dict(self, bullet, owner=PLAYER_OWNER):
+        return self.add(bullet['x'], bullet['y'], bullet['dx'], bullet['dy'],
+                        bullet['width'], bullet['height'], owner)
+
+    def step(self, moving=None):
+        """Move bullets (all, or those flagged in `moving`) and drop those that left the screen"""
+        n = self.count
+        if moving is None:
+            moving = self.alive[:n]
+        pos = self.pos[:n]
+        pos += self.vel[:n] * moving[:, None]
+        inside = ((pos[:, 0] >= 0) & (pos[:, 0] <= SCREEN_WIDTH) &
+                  (pos[:, 1] >= 0) & (pos[:, 1] <= SCREEN_HEIGHT))
+        self.alive[:n] &= inside
+        self._groups = None
+
+    def compact(self):
+        """Squeeze out dead bullets, preserving firing order"""
+        n = self.count
+        keep = self.alive[:n]
+        k = int(keep.sum())
+        self._groups = None
+        if k == n:
+            return
+        for name in ("pos", "vel", "size", "owner", "alive"):
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.count = k
+
+    def live_indices(self, owner=None):
+        n = self.count
+        if owner is None:
+            return np.flatnonzero(self.alive[:n])
+        if self._groups is None:
+            # Group every live bullet by owner once, so per-owner lookups
+            # within a frame do not each scan the whole store
+            live = np.flatnonzero(self.alive[:n])
+            owners = self.owner[live]
+            order = np.argsort(owners, kind="stable")
+            keys, starts = np.unique(owners[order], return_index=True)
+            self._groups = dict(zip(keys.tolist(), np.split(live[order], starts[1:])))
+        return self._groups.get(owner, EMPTY_INDICES)
+
+    def as_dict(self, i):
+        return {
+            'x': float(self.pos[i, 0]),
+            'y': float(self.pos[i, 1]),
+            'dx': float(self.vel[i, 0]),
+            'dy': float(self.vel[i, 1]),
+            'width': float(self.size[i, 0]),
+            'height': float(self.size[i, 1]),
+        }
+
+
+class BulletListView:
+    """
+    Stands in for an entity's `bullets` list when it is bound to a WorldState:
+    append() writes into the shared arrays, iteration yields read-only dict
+    snapshots so drawing, DODGE and controllers keep working unchanged.
+    """
+
+    def __init__(self, arrays, owner):
+        self.arrays = arrays
+        self.owner = owner
+
+    def append(self, bullet):
+        """Copy a pooled bullet dict into the arrays and hand the dict back"""
+        self.arrays.add_dict(bullet, self.owner)
+        bullet_pool.release(bullet)
+
+    def extend(self, bullets):
+        for bullet in bullets:
+            self.append(bullet)
+
+    def __iter__(self):
+        return (self.arrays.as_dict(i) for i in self.arrays.live_indices(self.owner))
+
+    def __getitem__(self, i):
+        return self.arrays.as_dict(self.arrays.live_indices(self.owner)[i])
+
+    def __len__(self):
+        return len(self.arrays.live_indices(self.owner))
+
+
+class WorldState:
+    """
+    Holds the bullet arrays for one episode. Enemies stay plain objects;
+    add_enemies() routes their bullets (and add_player() the player's) into
+    shared BulletArrays, and the update methods read enemy boxes once per
+    frame to collide them with whole arrays of bullets.
+    """
+
+    def __init__(self, bullet_capacity=256):
+        self.enemies = []
+        self.enemy_size = np.zeros((0, 2))
+        self.enemy_bullets = BulletArrays(bullet_capacity)
+        self.player_bullets = BulletArrays(bullet_capacity)
+
+    def add_enemies(self, enemies):
+        """Route enemies' bullets into the world arrays (replaces any previous set).
+        A bound enemy's bullets are advanced by update_enemy_bullets(), so do
+        not also call its own update_bullets()."""
+        self.enemies = list(enemies)
+        self.enemy_size = np.array([(e.width, e.height) for e in self.enemies], dtype=float).reshape(-1, 2)
+
+        for row, enemy in enumerate(self.enemies):
+            for bullet in enemy.bullets:
+                self.enemy_bullets.add_dict(bullet, row)
+            bullet_pool.reclaim([enemy])
+            enemy.bullets = BulletListView(self.enemy_bullets, row)
+
+    def add_player(self, player):
+        for bullet in player.bullets:
+            self.player_bullets.add_dict(bullet, PLAYER_OWNER)
+        bullet_pool.reclaim([player])
+        player.bullets = BulletListView(self.player_bullets, PLAYER_OWNER)
+        player.world = self
+
+    def enemy_alive(self):
+        return np.fromiter((e.alive for e in self.enemies), dtype=bool, count=len(self.enemies))
+
+    def enemy_positions(self, rows):
+        return np.array([(self.enemies[row].x, self.enemies[row].y) for row in rows], dtype=float).reshape(-1, 2)
+
+    def nearest_threat(self, x, y, radius):
+        """Closest enemy bullet moving down within `radius` of (x, y) as a dict, or None"""
+        bullets = self.enemy_bullets
+        live = bullets.live_indices()
+        live = live[bullets.vel[live, 1] > 0]
+        if not len(live):
+            return None
+        dist = np.hypot(bullets.pos[live, 0] - x, bullets.pos[live, 1] - y)
+        i = int(np.argmin(dist))
+        return bullets.as_dict(live[i]) if dist[i] < radius else None
+
+    def update_player_bullets(self):
+        """Replaces Player.update_bullets: move, cull and collide all player bullets with enemies"""
+        bullets = self.player_bullets
+        bullets.step()
+        live = bullets.live_indices()
+        rows = np.flatnonzero(self.enemy_alive())
+
+        bullet_idx, enemy_idx = find_hits(bullets.pos[live], bullets.size[live],
+                                          self.enemy_positions(rows.tolist()), self.enemy_size[rows])
+
+        # Resolve in firing order so a bullet only hits an enemy still alive
+        spent = set()
+        for b, e in zip(bullet_idx.tolist(), enemy_idx.tolist()):
+            if b in spent:
+                continue
+            enemy = self.enemies[rows[e]]
+            if enemy.alive:
+                enemy.take_damage(1)
+                bullets.alive[live[b]] = False
+                spent.add(b)
+
+        bullets.compact()
+
+    def update_enemy_bullets(self, player):
+        """Replaces Enemy.update_bullets for every enemy: move, cull and collide with the player"""
+        bullets = self.enemy_bullets
+        n = bullets.count
+        # Bullets of dead enemies stay frozen, as they do in the per-object
+        # loop, which only updates bullets of enemies still alive
+        moving = bullets.alive[:n] & self.enemy_alive()[bullets.owner[:n]]
+        bullets.step(moving)
+        target_pos = np.array([[player.x, player.y]], dtype=float)
+        target_size = np.array([[player.width, player.height]], dtype=float)
+        hits = moving & aabb_overlap(bullets.pos[:n], bullets.size[:n], target_pos, target_size)
+
+        # Apply hits enemy by enemy, as the per-object loop does, so the
+        # player's health sums damage in the same order
+        rows = np.flatnonzero(hits)
+        rows = rows[np.argsort(bullets.owner[rows], kind="stable")]
+        for i in rows.tolist():
+            enemy = self.enemies[bullets.owner[i]]
+            damage = enemy.phenotype.damage_per_hit
+            player.take_damage(damage)
+            enemy.damage_dealt += damage
+            enemy.hits_scored += 1
+
+        bullets.alive[:n] &= ~hits
+        bullets.compact()